@@ -2,9 +2,12 @@
 from enum import Enum
 from samson.utilities.exceptions import NoSolutionException
 from samson.core.base_object import BaseObject
+from samson.utilities.runtime import RUNTIME
 from samson.math.polynomial import Polynomial
 from typing import List
 from copy import copy
+from collections import deque
+from weakref import WeakValueDictionary
 import itertools
 
 
@@ -36,11 +39,127 @@ import itertools
 # ]
 
 
-class AnyConstraint(BaseObject):
+def _order_operands(a, b):
+    """
+    Addition commutes, so put operands in a canonical order before hitting the cache.
+    """
+    if hash(b) < hash(a):
+        return b, a
+
+    return a, b
+
+
+
+@RUNTIME.global_cache()
+def _cached_merge(a, b):
+    """
+    Memoizes the expensive `ConstraintSystem` and `OneOfConstraint` merges. Constraints
+    are never mutated after construction, so results can be shared.
+    """
+    return a._merge(b)
+
+
+
+def _pack_eqs(con_systems, sym_idx):
+    """
+    Packs the top-level EQs of each system into a `(mask, vals)` pair of integers.
+    """
+    packed = []
+    for con_sys in con_systems:
+        mask, vals = 0, 0
+        for con in con_sys.constraints:
+            if type(con) is EqualsConstraint:
+                bit   = 1 << sym_idx.setdefault(con.sym, len(sym_idx))
+                mask |= bit
+
+                if con.val:
+                    vals |= bit
+
+        packed.append((mask, vals))
+
+    return packed
+
+
+
+def _merge_oo(a_systems, b_systems):
+    """
+    Yields the pairs of systems whose EQs don't contradict. Conflicts are found
+    with packed bitmasks so obviously bad pairs never hit `ConstraintSystem.__add__`.
+
+    Symbols fixed by every branch on both sides act as a join key: `b_systems` is
+    bucketed by its values on them, so each `a` system only visits compatible branches.
+    """
+    a_systems = list(a_systems)
+    b_systems = list(b_systems)
+    sym_idx   = {}
+    a_packed  = _pack_eqs(a_systems, sym_idx)
+    b_packed  = _pack_eqs(b_systems, sym_idx)
+
+    key_mask = -1
+    for mask, _vals in a_packed + b_packed:
+        key_mask &= mask
+
+    buckets = {}
+    for o_con, (o_mask, o_vals) in zip(b_systems, b_packed):
+        buckets.setdefault(o_vals & key_mask, []).append((o_con, o_mask, o_vals))
+
+    for s_con, (s_mask, s_vals) in zip(a_systems, a_packed):
+        for o_con, o_mask, o_vals in buckets.get(s_vals & key_mask, []):
+            if not s_mask & o_mask & (s_vals ^ o_vals):
+                yield s_con, o_con
+
+
+
+def _coalesce_branches(syms, con_systems) -> frozenset:
+    """
+    A branch whose EQs pin every symbol in `syms` is exactly that assignment, so any
+    ANYs riding along are redundant. Stripping them lets branches that only differ
+    by those ANYs collapse into one.
+    """
+    coalesced = set()
+    for con_sys in con_systems:
+        eqs = [con for con in con_sys.constraints if type(con) is EqualsConstraint]
+
+        if len(eqs) < len(con_sys.constraints) and all(type(con) in (EqualsConstraint, AnyConstraint) for con in con_sys.constraints) and syms <= {eq.sym for eq in eqs}:
+            con_sys = ConstraintSystem._from_frozenset(frozenset(eqs))
+
+        coalesced.add(con_sys)
+
+    return frozenset(coalesced)
+
+
+
+class Constraint(BaseObject):
+    __slots__ = ('__weakref__',)
+
+    def _add_or_none(self, other):
+        """
+        Adds `other` to `self`, returning None instead of raising on contradiction.
+        """
+        raise NotImplementedError
+
+
+    def __add__(self, other):
+        result = self._add_or_none(other)
+
+        if result is None:
+            raise NoSolutionException
+
+        return result
+
+
+
+class AnyConstraint(Constraint):
+    __slots__ = ('sym',)
+
     def __init__(self, sym: str) -> None:
         self.sym = sym
 
 
+    def __reprdir__(self):
+        return ['sym']
+
+
     def __hash__(self):
         return hash((self.__class__, self.sym))
 
@@ -56,7 +175,7 @@ class AnyConstraint(BaseObject):
         return sym == self.sym
 
 
-    def __add__(self, other):
+    def _add_or_none(self, other):
         if type(self) == type(other):
             if self.sym == other.sym:
                 return ConstraintSystem([self])
@@ -64,14 +183,46 @@ class AnyConstraint(BaseObject):
                 return ConstraintSystem([self, other])
 
         else:
-            return other + self
+            return other._add_or_none(self)
 
 
 
-class EqualsConstraint(BaseObject):
+class EqualsConstraint(Constraint):
+    __slots__ = ('sym', 'val', '_as_cs')
+    _INTERNED = WeakValueDictionary()
+
     def __init__(self, sym: str, val: int) -> None:
-        self.sym = sym
-        self.val = val
+        self.sym    = sym
+        self.val    = val
+        self._as_cs = None
+
+
+    @staticmethod
+    def get(sym: str, val: int) -> 'EqualsConstraint':
+        """
+        Returns the interned constraint for `(sym, val)`, creating it if necessary.
+        """
+        con = EqualsConstraint._INTERNED.get((sym, val))
+
+        if con is None:
+            con = EqualsConstraint(sym, val)
+            EqualsConstraint._INTERNED[(sym, val)] = con
+
+        return con
+
+
+    def __reprdir__(self):
+        return ['sym', 'val']
+
+
+    def as_system(self) -> 'ConstraintSystem':
+        """
+        Returns (and caches) the system containing only `self`.
+        """
+        if self._as_cs is None:
+            self._as_cs = ConstraintSystem([self])
+
+        return self._as_cs
     
 
     def __hash__(self):
@@ -101,14 +252,17 @@ class EqualsConstraint(BaseObject):
             raise NotImplementedError
     
 
-    def __add__(self, other):
+    def _add_or_none(self, other):
+        if self is other:
+            return self.as_system()
+
         if type(other) is EqualsConstraint:
             # We already have an equals constraint; make sure they don't contradict
             if self.sym == other.sym:
                 if self.val == other.val:
-                    return ConstraintSystem([self])
+                    return self.as_system()
                 else:
-                    raise NoSolutionException
+                    return None
             else:
                 return ConstraintSystem([self, other])
 
@@ -122,23 +276,21 @@ class EqualsConstraint(BaseObject):
                     good_constraints = set()
 
                     for sub_con in sub_con_system.constraints:
+                        sub_sum = self._add_or_none(sub_con)
 
-                        try:
-                            mod_constraint = (self + sub_con).constraints
+                        if sub_sum is None:
+                            satisfied = False
+                            break
 
-                            if self in mod_constraint:
-                                mod_constraint.remove(self)
+                        mod_constraint = sub_sum.constraints - {self}
 
-                            for con in mod_constraint:
-                                if type(con) is OneOfConstraint and con.simplify():
-                                    con = con.simplify()
+                        for con in mod_constraint:
+                            if type(con) is OneOfConstraint and con.simplify():
+                                con = con.simplify()
 
-                                    good_constraints = good_constraints.union(con.constraints)
-                                else:
-                                    good_constraints.add(con)
-                        except NoSolutionException:
-                            satisfied = False
-                            break
+                                good_constraints = good_constraints.union(con.constraints)
+                            else:
+                                good_constraints.add(con)
 
                     if satisfied and good_constraints:
                         con_sys = ConstraintSystem(good_constraints)
@@ -149,7 +301,7 @@ class EqualsConstraint(BaseObject):
 
                 if new_one_of:
                     if len(new_one_of) == 1:
-                        constraints = list(new_one_of[0].constraints)
+                        constraints = new_one_of[0].constraints
                     else:
                         oneof = OneOfConstraint([s for s in other.syms if s != self.sym], new_one_of)
                         simp  = oneof.simplify()
@@ -157,11 +309,11 @@ class EqualsConstraint(BaseObject):
                         if simp:
                             return simp
     
-                        constraints = [oneof]
+                        constraints = (oneof,)
 
-                    return ConstraintSystem([self] + constraints)
+                    return ConstraintSystem._from_frozenset(frozenset(constraints) | {self})
                 else:
-                    raise NoSolutionException
+                    return None
 
             else:
                 return ConstraintSystem([self, other])
@@ -169,22 +321,45 @@ class EqualsConstraint(BaseObject):
 
         elif type(other) is AnyConstraint:
             if self.sym == other.sym:
-                return ConstraintSystem([self])
+                return self.as_system()
             else:
                 return ConstraintSystem([self, other])
 
         elif type(other) is ConstraintSystem:
-            return other + self
+            return other._add_or_none(self)
         
         else:
             raise NotImplementedError(f"Add not implemented for {self.__class__.__name__} and {other.__class__.__name__}")
 
 
 
-class OneOfConstraint(BaseObject):
+class OneOfConstraint(Constraint):
+    __slots__ = ('syms', 'con_sys', '_hash')
+    _INTERNED = WeakValueDictionary()
+
     def __init__(self, syms: list, con_sys: List['ConstraintSystem']) -> None:
-        self.syms = set(syms)
-        self.con_sys = set(con_sys)
+        self.syms    = frozenset(syms)
+        self.con_sys = _coalesce_branches(self.syms, con_sys)
+        self._hash   = hash((self.__class__, self.syms, self.con_sys))
+
+
+    def __reprdir__(self):
+        return ['syms', 'con_sys']
+
+
+    @staticmethod
+    def get(syms: list, con_sys: List['ConstraintSystem']) -> 'OneOfConstraint':
+        """
+        Returns the interned constraint for `(syms, con_sys)`, creating it if necessary.
+        """
+        key = (frozenset(syms), frozenset(con_sys))
+        con = OneOfConstraint._INTERNED.get(key)
+
+        if con is None:
+            con = OneOfConstraint(*key)
+            OneOfConstraint._INTERNED[key] = con
+
+        return con
 
 
     def constrains(self, sym):
@@ -196,7 +371,7 @@ class OneOfConstraint(BaseObject):
             return ConstraintSystem([AnyConstraint(s) for s in self.syms])
 
         elif len(self.con_sys) == 1:
-            return list(self.con_sys)[0]
+            return next(iter(self.con_sys))
 
         else:
             gens = [(a, {tuple(sorted(tuple(dic.items()))) for dic in a.generate()}) for a in self.con_sys]
@@ -214,7 +389,7 @@ class OneOfConstraint(BaseObject):
             new_con_sys = self.con_sys.difference(bad_con_sys)
             syms = set()
             for c in new_con_sys:
-                syms = syms.union(c.get_syms())
+                syms = syms.union(c.syms)
 
             if len(new_con_sys) < len(self.con_sys):
                 oo = OneOfConstraint(syms, new_con_sys)
@@ -243,7 +418,7 @@ class OneOfConstraint(BaseObject):
 
         syms = set()
         for c in n_oo:
-            syms = syms.union(c.get_syms())
+            syms = syms.union(c.syms)
 
         oo = OneOfConstraint(syms, n_oo)
         result = oo.simplify() or oo
@@ -261,40 +436,22 @@ class OneOfConstraint(BaseObject):
 
 
     def __hash__(self):
-        return hash((self.__class__, tuple(self.syms), tuple(self.con_sys)))
+        return self._hash
 
 
     def __eq__(self, other) -> bool:
         return type(self) == type(other) and self.syms == other.syms and self.con_sys == other.con_sys
     
 
-    def __add__(self, other):
+    def _add_or_none(self, other):
+        if self == other:
+            return ConstraintSystem([self])
+
         if type(other) is EqualsConstraint:
-            return other + self
+            return other._add_or_none(self)
 
         elif type(other) is OneOfConstraint:
-            subset = set()
-            for s_con in self.con_sys:
-                for o_con in other.con_sys:
-                    try:
-                        subset.add(s_con + o_con)
-                    except NoSolutionException:
-                        pass
-
-            if not subset:
-                raise NoSolutionException
-
-            if len(subset) == 1:
-                return list(subset)[0]
-            
-            syms  = self.syms.union(other.syms)
-            oneof = OneOfConstraint(syms, subset)
-            simp  = oneof.simplify()
-
-            if simp:
-                return simp 
-
-            return ConstraintSystem([oneof])
+            return _cached_merge(*_order_operands(self, other))
 
         elif type(other) is AnyConstraint:
             if other.sym in self.syms:
@@ -303,20 +460,70 @@ class OneOfConstraint(BaseObject):
                 return ConstraintSystem([self, other])
 
         elif type(other) is ConstraintSystem:
-            return other + self
+            return other._add_or_none(self)
 
         else:
             raise NotImplementedError(f"Add not implemented for {self.__class__.__name__} and {other.__class__.__name__}")
 
 
+    def _merge(self, other: 'OneOfConstraint'):
+        subset = set()
+        for s_con, o_con in _merge_oo(self.con_sys, other.con_sys):
+            merged = s_con._add_or_none(o_con)
+
+            if merged is not None:
+                subset.add(merged)
+
+        if not subset:
+            return None
+
+        if len(subset) == 1:
+            return next(iter(subset))
+        
+        syms  = self.syms.union(other.syms)
+        oneof = OneOfConstraint(syms, subset)
+        simp  = oneof.simplify()
+
+        if simp:
+            return simp 
+
+        return ConstraintSystem([oneof])
+
+
+
+class ConstraintSystem(Constraint):
+    __slots__ = ('constraints', '_hash', '_by_sym', '_syms')
 
-class ConstraintSystem(BaseObject):
     def __init__(self, constraints=None) -> None:
-        self.constraints = set(constraints or [])
+        self.constraints = frozenset(constraints or [])
+        self._hash       = hash((self.__class__, self.constraints))
+        self._by_sym     = None
+        self._syms       = None
+
+
+    @classmethod
+    def _from_frozenset(cls, constraints: frozenset) -> 'ConstraintSystem':
+        """
+        Builds a system directly from a frozenset we already own, skipping the copy in `__init__`.
+        """
+        con_sys = cls.__new__(cls)
+        con_sys.constraints = constraints
+        con_sys._hash       = hash((cls, constraints))
+        con_sys._by_sym     = None
+        con_sys._syms       = None
+        return con_sys
+
+
+    def __reprdir__(self):
+        return ['constraints']
 
 
     def __hash__(self):
-        return hash((self.__class__, tuple(self.constraints)))
+        return self._hash
+
+
+    def __eq__(self, other) -> bool:
+        return type(self) == type(other) and self.constraints == other.constraints
     
 
     def generate(self):
@@ -325,7 +532,7 @@ class ConstraintSystem(BaseObject):
         for product in itertools.product(*[con.generate() for con in self.constraints]):
             combined = {}
 
-            for g in list(product):
+            for g in product:
                 combined.update(g)
 
             results.add(tuple(sorted(tuple(combined.items()))))
@@ -333,27 +540,60 @@ class ConstraintSystem(BaseObject):
         return [dict(r) for r in results]
     
 
+    def _sym_index(self) -> dict:
+        """
+        Maps each symbol to the constraints that reference it. Systems are never
+        mutated after construction, so this is computed once.
+        """
+        if self._by_sym is None:
+            by_sym = {}
+            for con in self.constraints:
+                for sym in ((con.sym,) if hasattr(con, 'sym') else con.syms):
+                    by_sym.setdefault(sym, []).append(con)
+
+            self._by_sym = by_sym
+
+        return self._by_sym
+
+
+    @property
+    def syms(self) -> frozenset:
+        if self._syms is None:
+            self._syms = frozenset(self._sym_index())
+
+        return self._syms
+
+
+    def constrains(self, sym) -> bool:
+        return sym in self._sym_index()
+
+
+    def constraints_on(self, sym) -> list:
+        return self._sym_index().get(sym, [])
+
+
     def get_syms(self):
-        syms = set()
-        for con in self.constraints:
-            if hasattr(con, 'sym'):
-                syms.add(con.sym)
-            else:
-                syms = syms.union(con.syms)
-        return syms
+        return self.syms
 
 
 
-    def __add__(self, other):
+    def _add_or_none(self, other):
         if type(other) is not ConstraintSystem:
             other = ConstraintSystem([other])
+
+        if self is other or self.constraints == other.constraints:
+            return self
         
         if not self.constraints:
             return other
 
-        if not other.constraints:
+        if other is EMPTY_CS or not other.constraints:
             return self
 
+        return _cached_merge(*_order_operands(self, other))
+
+
+    def _merge(self, other: 'ConstraintSystem'):
         # STEP 1: Separate ALL EQs into single EQ system
         # STEP 2: Separate ALL OOs into single OO system
         # STEP 3: Merge EQs and OOs
@@ -375,16 +615,13 @@ class ConstraintSystem(BaseObject):
         s_eq = s_type_map[EqualsConstraint]
         o_eq = o_type_map[EqualsConstraint]
 
-        eq_constraints = set()
-        for s in s_eq:
-            for o in o_eq:
-                s + o
-                eq_constraints.add(o)
-            eq_constraints.add(s)
+        # Only EQs over the same symbol can interact, so join on the symbol
+        s_eq_vals = {eq.sym: eq.val for eq in s_eq}
+        for o in o_eq:
+            if s_eq_vals.get(o.sym, o.val) != o.val:
+                return None
 
-
-        if not s_eq:
-            eq_constraints = set(o_eq)
+        eq_constraints = s_eq | o_eq
 
 
         s_oo = s_type_map[OneOfConstraint]
@@ -405,7 +642,10 @@ class ConstraintSystem(BaseObject):
                 curr = oo
                 for eq in copy(eq_constraints):
                     if eq.sym in oo.syms:
-                        curr += eq
+                        curr = curr._add_or_none(eq)
+
+                        if curr is None:
+                            return None
 
                         # Remove eq from the system
                         c_type_map = separate_by_type(curr.constraints)
@@ -418,7 +658,7 @@ class ConstraintSystem(BaseObject):
 
                         # Check if it's been decomposed
                         if oos:
-                            curr = list(oos)[0]
+                            curr = next(iter(oos))
                             if curr != oo:
                                 changed = True
                         else:
@@ -442,12 +682,22 @@ class ConstraintSystem(BaseObject):
         
 
         # Combine OOs
-        while len(simplified_oos) > 1:
-            l_oo = list(simplified_oos)
-            oo_a, oo_b = l_oo[:2]
-            simplified_oos = set(l_oo[2:])
+        # `pending` mirrors the queue so duplicates are still collapsed
+        work    = deque(simplified_oos)
+        pending = set(simplified_oos)
 
-            combined_oos = (oo_a + oo_b).constraints
+        while len(work) > 1:
+            oo_a = work.popleft()
+            oo_b = work.popleft()
+            pending.discard(oo_a)
+            pending.discard(oo_b)
+
+            combined_oos = oo_a._add_or_none(oo_b)
+
+            if combined_oos is None:
+                return None
+
+            combined_oos = combined_oos.constraints
 
             for combined in combined_oos:
                 if type(combined) is AnyConstraint:
@@ -456,24 +706,17 @@ class ConstraintSystem(BaseObject):
                 elif type(combined) is EqualsConstraint:
                     eq_constraints.add(combined)
 
-                else:
-                    simplified_oos.add(combined)
+                elif combined not in pending:
+                    work.append(combined)
+                    pending.add(combined)
 
+        simplified_oos = set(work)
 
-        any_cons     = extracted_anys.union(s_type_map[AnyConstraint]).union(o_type_map[AnyConstraint])
-        removed_anys = set()
+        any_cons = extracted_anys.union(s_type_map[AnyConstraint]).union(o_type_map[AnyConstraint])
 
         # Prune anys
-        for any_c in any_cons:
-            for oo in simplified_oos:
-                if any_c.sym in oo.syms:
-                    removed_anys.add(any_c)
-                    break
-
-            for eq in eq_constraints:
-                if any_c.sym == eq.sym:
-                    removed_anys.add(any_c)
-                    break
+        constrained_syms = {eq.sym for eq in eq_constraints}.union(*[oo.syms for oo in simplified_oos])
+        removed_anys     = {any_c for any_c in any_cons if any_c.sym in constrained_syms}
         
 
 
@@ -489,19 +732,21 @@ class ConstraintSystem(BaseObject):
 
 
         # Check that EQs don't contradict
-        for eq_a in eq_constraints:
-            for eq_b in eq_constraints:
-                try:
-                    eq_a + eq_b
-                except NoSolutionException:
-                    raise NoSolutionException
+        eq_vals = {}
+        for eq in eq_constraints:
+            if eq_vals.setdefault(eq.sym, eq.val) != eq.val:
+                return None
 
 
         good_anys = any_cons.difference(removed_anys)
-        result = ConstraintSystem(good_anys.union(eq_constraints).union(re_simplified))
+        result = ConstraintSystem._from_frozenset(frozenset().union(good_anys, eq_constraints, re_simplified))
         return result
 
 
+EMPTY_CS = ConstraintSystem()
+
+
+
 class SolveFor(Enum):
     ONE  = 1
     ZERO = 0
@@ -510,130 +755,200 @@ class SolveFor(Enum):
 
 def bv_process(bv, outputs):
     constraints = ConstraintSystem([AnyConstraint(var.repr) for sublist in bv.vars.vars for var in sublist])
+    cache       = {}
+
     for s, out in zip(bv.symbols, outputs):
         p = s.value
         if type(out) is SolveFor:
             out = out.value
 
         if out != "x":
-            constraints = poly_rec(p, out, constraints)
+            constraints = poly_rec(p, out, constraints, cache)
 
     return constraints
 
 
-def poly_rec(p, output, constraints):
-    if type(p) is not Polynomial:
-        # p not poly; abort
-        return constraints
+def _add_branches(constraints, syms, branch_a, branch_b):
+    """
+    Adds `OneOf(branch_a, branch_b)` to `constraints`, falling back to whichever
+    branch is still satisfiable. `None` branches are contradictions.
+    """
+    result = None
+    if branch_a is not None and branch_b is not None:
+        result = constraints._add_or_none(OneOfConstraint.get(syms, [branch_a, branch_b]))
 
-    a = p.symbol.repr
+    if result is None and branch_a is not None:
+        result = constraints._add_or_none(branch_a)
 
-    # x*a == 1, then x == 1 AND a == 1
-    if not p[0] and output:
-        if not p[1]:
-            raise NoSolutionException
+    if result is None and branch_b is not None:
+        result = constraints._add_or_none(branch_b)
+
+    if result is None:
+        raise NoSolutionException
+
+    return result
 
-        constraints += EqualsConstraint(a, 1)
-        constraints  = poly_rec(p[1], output, constraints)
-        # not p[0] and output RECURSIVE RETURN
 
-    # x*a == 0, then (x == 0 AND a == 0) OR (x == 0 AND a == 1) OR (x == 1 OR a == 0)
-    elif not p[0] and not output:
-        if p[1] == p.coeff_ring.one:
-            constraints += EqualsConstraint(a, output)
-            return constraints
 
+def poly_rec(p, output, constraints, cache: dict=None):
+    """
+    Solves `p == output` on top of `constraints`.
 
-        # not p[0] and not output; solving p[1] for 0
-        x_cons_0 = poly_rec(p[1], 0, ConstraintSystem())
+    Subproblems are always solved against an empty system, so they only depend on
+    `(p, output)`. They're driven from an explicit stack instead of recursing and
+    their results (`None` for no solution) are memoized in `cache`.
+    """
+    if cache is None:
+        cache = {}
 
-        # not p[0] and not output; solving p[1] for 1
+    stack  = [(_poly_rec(p, output, constraints), None)]
+    result = None
+
+    while stack:
+        gen, key = stack[-1]
 
-        # We only need this for the variables. If it doesn't work,
-        # just throw it out. This should really only happen if
-        # we're dealing with a constant anyway
         try:
-            x_cons_1 = poly_rec(p[1], 1, ConstraintSystem())
-            x_cons_1_syms = x_cons_1.get_syms()
+            child  = gen.send(result)
+            result = None
+
+            if child in cache:
+                result = cache[child]
+            else:
+                stack.append((_poly_rec(*child, EMPTY_CS), child))
+
+        except StopIteration as e:
+            stack.pop()
+            result = e.value
+
+            if key is not None:
+                cache[key] = result
+
         except NoSolutionException:
-            x_cons_1_syms = set()
+            stack.pop()
 
-        any_syms   = x_cons_0.get_syms().union(x_cons_1_syms)
-        x_cons_any = [AnyConstraint(s) for s in any_syms]
+            if not stack:
+                raise
 
-        assert a not in any_syms
+            result     = None
+            cache[key] = None
 
-        constraints += OneOfConstraint({a}.union(any_syms), [
-            ConstraintSystem([EqualsConstraint(a, 0), *x_cons_any]),
-            ConstraintSystem([AnyConstraint(a), *x_cons_0.constraints])
-        ])
+    return result
 
 
-    # This layer is null, just hop to the next
-    elif p[0] and not p[1]:
 
-        # If the constant doesn't match the output, throw
-        if p[0] == p.coeff_ring.one:
-            if not output:
-                raise NoSolutionException
-        else:
-            constraints = poly_rec(p[0], output, constraints)
+def _poly_rec(p, output, constraints):
+    """
+    Body of `poly_rec`. Tail calls are looped over in-place and subproblems are
+    requested by yielding `(p, output)`; the driver sends back their solution.
+    """
+    while type(p) is Polynomial:
+        # Indexing a nested polynomial rebuilds the coefficient, so only do it once per layer
+        a   = p.symbol.repr
+        p0  = p[0]
+        p1  = p[1]
+        one = p.coeff_ring.one
 
-    # If we're here, p0 and p1 have values
-    elif output:
-        # p0 AND p1, output == 1
+        # x*a == 1, then x == 1 AND a == 1
+        if not p0 and output:
+            if not p1:
+                raise NoSolutionException
 
-        # 1 here means p0 != p1 (p1 + p0 = 1)
-        # Check for constant
-        # p1 + 1 = 1
-        # p1 = 0; Solve p1 for 0!
-        if p[0] == p.coeff_ring.one:
-            constraints = poly_rec(p[1]*p.symbol, 0, constraints)
+            constraints += EqualsConstraint.get(a, 1)
+            p = p1
+            # not p[0] and output RECURSIVE RETURN
 
-        # Non constant p[0]; handle symbols
-        else:
-            p0_cons_0 = poly_rec(p[0], 0, ConstraintSystem())
-            p0_cons_1 = poly_rec(p[0], 1, ConstraintSystem())
-            p1_cons_0 = poly_rec(p[1]*p.symbol, 0, ConstraintSystem())
-            p1_cons_1 = poly_rec(p[1]*p.symbol, 1, ConstraintSystem())
+        # x*a == 0, then (x == 0 AND a == 0) OR (x == 0 AND a == 1) OR (x == 1 OR a == 0)
+        elif not p0 and not output:
+            if p1 == one:
+                constraints += EqualsConstraint.get(a, output)
+                return constraints
 
-            syms = {a}.union(p0_cons_0.get_syms()).union(p0_cons_1.get_syms()).union(p1_cons_0.get_syms()).union(p1_cons_1.get_syms())
 
-            try:
-                constraints += OneOfConstraint(syms, [
-                    p0_cons_0 + p1_cons_1,
-                    p0_cons_1 + p1_cons_0
-                ])
-            except NoSolutionException:
-                try:
-                    constraints += p0_cons_0 + p1_cons_1
-                except NoSolutionException:
-                    constraints += p0_cons_1 + p1_cons_0
+            # not p0 and not output; solving p1 for 0
+            x_cons_0 = yield p1, 0
 
+            if x_cons_0 is None:
+                raise NoSolutionException
 
-    else:
-        # p0 AND p1, output == 0
-        if p[0] == p.coeff_ring.one:
-            return poly_rec(p[1]*p.symbol, 1, constraints)
+            # not p0 and not output; solving p1 for 1
 
-        p0_cons_0 = poly_rec(p[0], 0, ConstraintSystem())
-        p0_cons_1 = poly_rec(p[0], 1, ConstraintSystem())
-        p1_cons_0 = poly_rec(p[1]*p.symbol, 0, ConstraintSystem())
-        p1_cons_1 = poly_rec(p[1]*p.symbol, 1, ConstraintSystem())
+            # We only need this for the variables. If it doesn't work,
+            # just throw it out. This should really only happen if
+            # we're dealing with a constant anyway
+            x_cons_1 = yield p1, 1
+            x_cons_1_syms = x_cons_1.syms if x_cons_1 is not None else frozenset()
 
-        syms = {a}.union(p0_cons_0.get_syms()).union(p0_cons_1.get_syms()).union(p1_cons_0.get_syms()).union(p1_cons_1.get_syms())
+            any_syms   = x_cons_0.syms | x_cons_1_syms
+            x_cons_any = [AnyConstraint(s) for s in any_syms]
 
+            assert a not in any_syms
 
-        try:
-            constraints += OneOfConstraint(syms, [
-                p0_cons_0 + p1_cons_0,
-                p0_cons_1 + p1_cons_1
+            constraints += OneOfConstraint.get({a}.union(any_syms), [
+                ConstraintSystem([EqualsConstraint.get(a, 0), *x_cons_any]),
+                ConstraintSystem([AnyConstraint(a), *x_cons_0.constraints])
             ])
-        except NoSolutionException:
-            try:
-                constraints += p0_cons_0 + p1_cons_0
-            except NoSolutionException:
-                constraints += p0_cons_1 + p1_cons_1
+            return constraints
+
+
+        # This layer is null, just hop to the next
+        elif p0 and not p1:
+
+            # If the constant doesn't match the output, throw
+            if p0 == one:
+                if not output:
+                    raise NoSolutionException
+
+                return constraints
+            else:
+                p = p0
+
+        # If we're here, p0 and p1 have values
+        elif output:
+            # p0 AND p1, output == 1
+
+            # 1 here means p0 != p1 (p1 + p0 = 1)
+            # Check for constant
+            # p1 + 1 = 1
+            # p1 = 0; Solve p1 for 0!
+            if p0 == one:
+                p, output = p1*p.symbol, 0
+
+            # Non constant p0; handle symbols
+            else:
+                p0_cons_0, p0_cons_1, p1_cons_0, p1_cons_1 = yield from _solve_both(p0, p1*p.symbol)
+
+                syms = {a} | p0_cons_0.syms | p0_cons_1.syms | p1_cons_0.syms | p1_cons_1.syms
+                return _add_branches(constraints, syms, p0_cons_0._add_or_none(p1_cons_1), p0_cons_1._add_or_none(p1_cons_0))
+
+
+        else:
+            # p0 AND p1, output == 0
+            if p0 == one:
+                p, output = p1*p.symbol, 1
+                continue
+
+            p0_cons_0, p0_cons_1, p1_cons_0, p1_cons_1 = yield from _solve_both(p0, p1*p.symbol)
+
+            syms = {a} | p0_cons_0.syms | p0_cons_1.syms | p1_cons_0.syms | p1_cons_1.syms
+            return _add_branches(constraints, syms, p0_cons_0._add_or_none(p1_cons_0), p0_cons_1._add_or_none(p1_cons_1))
 
 
     return constraints
+
+
+
+def _solve_both(p0, p1_shifted):
+    """
+    Requests `p0` and `p1_shifted` solved for both 0 and 1. Any contradiction is fatal.
+    """
+    results = []
+    for sub_p in (p0, p1_shifted):
+        for output in (0, 1):
+            sub_cons = yield sub_p, output
+
+            if sub_cons is None:
+                raise NoSolutionException
+
+            results.append(sub_cons)
+
+    return results
@@ -1,21 +1,30 @@
 
 from samson.math.factorization.siqs import BMatrix, ge_f2_nullspace, solve_row
 from samson.utilities.bytes import Bytes
+from functools import reduce
+from operator import xor
 
 
 class Collider(object):
+    __slots__ = ('nullspace', 'data_size', '_ns_ints')
+
     def __init__(self, data_size, nullspace=None) -> None:
         self.nullspace = nullspace
         self.data_size = data_size
 
+        # XOR whole vectors as ints instead of byte-by-byte through `Bytes.__xor__`
+        self._ns_ints = [vec.int() for vec in nullspace or []]
+
 
     def produce_collision(self, index):
-        result = Bytes().zfill(self.data_size)
-        for vec, coeff in zip(self.nullspace, [int(b) for b in bin(index)[2:].zfill(len(self.nullspace))]):
-            if coeff:
+        # The first vector of the nullspace is selected by the MSB of `index`
+        result = 0
+        n      = len(self._ns_ints)
+        for k, vec in enumerate(self._ns_ints):
+            if (index >> (n-1-k)) & 1:
                 result ^= vec
-        
-        return result
+
+        return Bytes(int.to_bytes(result, self.data_size, 'big'))
 
 
     def __len__(self):
@@ -24,52 +33,62 @@ class Collider(object):
 
     def __getitem__(self, idx):
         if idx < 0:
-            idx = len(self) - idx
+            idx = len(self) + idx
         
-        if idx >= len(self):
+        if not 0 <= idx < len(self):
             raise IndexError
 
         return self.produce_collision(idx)
 
 
     def __iter__(self):
-        for i in range(len(self)):
-            yield self[i]
+        """
+        Walks the collisions in Gray code order so each step is a single XOR onto the last.
+        """
+        n      = len(self._ns_ints)
+        result = 0
+        yield Bytes(int.to_bytes(result, self.data_size, 'big'))
+
+        for i in range(1, len(self)):
+            # Consecutive Gray codes differ in the lowest set bit of `i`
+            k       = (i & -i).bit_length() - 1
+            result ^= self._ns_ints[n-1-k]
+            yield Bytes(int.to_bytes(result, self.data_size, 'big'))
 
 
 
     def solve_for_mask(self, mask):
-        B = BMatrix([z.int() & mask for z in self.nullspace], num_cols=self.data_size*8)
+        B = BMatrix([z & mask for z in self._ns_ints], num_cols=self.data_size*8)
         sols, marks, M = ge_f2_nullspace(B.T)
         nullspace      = []
 
         for sol in sols:
             sol_vec = solve_row(sol, M, marks)
-            result  = Bytes().zfill(self.data_size)
-
-            for i in sol_vec:
-                result ^= self.nullspace[i]
-            
-            nullspace.append(result)
+            result  = reduce(xor, [self._ns_ints[i] for i in sol_vec], 0)
+            nullspace.append(Bytes(int.to_bytes(result, self.data_size, 'big')))
         
         return Collider(self.data_size, nullspace=nullspace)
 
 
 
 class CRCCollider(Collider):
+    __slots__ = ('crc_func', 'crc_size', 'matrix_info')
+
     def __init__(self, crc_func, data_size, crc_size=None):
         self.crc_func  = crc_func
         self.crc_size  = crc_size
         self.data_size = data_size
         self.matrix_info = None
-        self.nullspace = self.find_collisions()
+        super().__init__(data_size, self.find_collisions())
 
 
 
     def find_collisions(self):
-        c = self.crc_func(Bytes().zfill(self.data_size))
+        c = self.crc_func(Bytes(bytes(self.data_size)))
 
-        rows     = [self.crc_func(Bytes(1 << i).zfill(self.data_size)) for i in range(self.data_size*8)]
+        # `crc_func` is a black box, so each basis row needs its own call. Build
+        # the single-bit messages directly rather than through `Bytes.zfill`.
+        rows     = [self.crc_func(Bytes(int.to_bytes(1 << i, self.data_size, 'big'))) for i in range(self.data_size*8)]
         crc_size = self.crc_size or max(rows, key=lambda k: k.bit_length()).bit_length()
 
         B = BMatrix(rows, num_cols=crc_size)
@@ -81,9 +100,17 @@ class CRCCollider(Collider):
         for sol in sols:
             sol_vec   = solve_row(sol, M, marks)
             res       = sum([1 << i for i in sol_vec])
-            bytes_rep = Bytes(res).zfill(self.data_size)
+            bytes_rep = Bytes(int.to_bytes(res, self.data_size, 'big'))
+
+            # CRCs are affine over GF(2): crc(x) = L(x) ^ c. XORing the rows gives
+            # L(x) ^ (|sol_vec| mod 2)*c, so the collision check is just this XOR.
+            # A user-supplied `crc_size` may not cover the whole output, so check those for real.
+            if self.crc_size:
+                collides = self.crc_func(bytes_rep) == c
+            else:
+                collides = not reduce(xor, [rows[i] for i in sol_vec], c if len(sol_vec) % 2 else 0)
 
-            if self.crc_func(bytes_rep) == c:
+            if collides:
                 results.append(bytes_rep)
 
         return results
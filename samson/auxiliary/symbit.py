@@ -5,9 +5,12 @@ from samson.math.algebra.rings.integer_ring import ZZ
 from samson.math.symbols import Symbol
 from samson.utilities.bytes import Bytes
 from samson.auxiliary.constraint_system import bv_process, SolveFor
+from samson.utilities.runtime import RUNTIME
 from copy import copy
+from functools import wraps
 from typing import List
 import linecache
+import re
 from enum import Enum
 import itertools
 import inspect
@@ -40,10 +43,46 @@ _OP_MAP_SYM = {
     Op.EQ: '==',
 }
 
+_F2 = ZZ/ZZ(2)
+
+# Runs of `& 1`, `~~` and spaces. `reconstruct` drops the tokens and collapses the spaces.
+_CLEANUP = re.compile(r'(?:& 1|~~| )+')
+
+
+def _cleanup_run(match):
+    # Each `& 1` accounts for one space; any beyond that were real separators
+    run = match.group()
+    return ' ' if run.count(' ') > run.count('& 1') else ''
+
+
+
+def _variables(poly) -> set:
+    """
+    Names of the symbols `poly` depends on.
+    """
+    names = set()
+    if type(poly) is Polynomial:
+        for deg, coeff in enumerate(poly):
+            if coeff:
+                if deg:
+                    names.add(poly.symbol.repr)
+
+                names |= _variables(coeff)
+
+    return names
+
+
 
 def parse_poly(poly, OP_MAP):
-    coeffs  = list(poly)
-    content = poly.content()
+    coeffs = list(poly)
+
+    # `content` is a multivariate gcd and dominates the cost. Coefficients without a
+    # variable in common can only share a constant, so skip it for them.
+    supports = [_variables(c) for c in coeffs if c]
+    if supports and set.intersection(*supports):
+        content = poly.content()
+    else:
+        content = poly.coeff_ring.one
 
     if content > poly.coeff_ring.one:
         return f'{parse_poly(content, OP_MAP)} & {parse_poly(poly // content, OP_MAP)}'
@@ -97,56 +136,293 @@ def parse_poly(poly, OP_MAP):
 
 
 
-def collapse_poly(poly):
+# ANF monomials are bitmasks over the ring's parameters; the empty monomial is the constant 1
+_ZERO_ANF = frozenset()
+_ONE_ANF  = frozenset([0])
+
+
+def _ring_params(ring) -> tuple:
+    """
+    Parameter names of `ring`, innermost first. Parameter `i` is bit `i` of a monomial.
+    """
+    # Not cached: `PolynomialRing.__eq__` ignores symbols, so rings of equal depth collide
+    params = []
+    while type(ring) is PolynomialRing:
+        params.append(ring.symbol.repr)
+        ring = ring.ring
+
+    return tuple(params[::-1])
+
+
+
+def _anf_mul(a: frozenset, b: frozenset) -> frozenset:
+    """
+    Multiplies two ANFs. Every variable is idempotent, so monomials multiply by OR'ing
+    their masks, and equal products cancel in pairs.
+    """
+    if len(a) > len(b):
+        a, b = b, a
+
+    if a == _ONE_ANF:
+        return b
+
+    result = set()
+    for m_a in a:
+        for m_b in b:
+            m = m_a | m_b
+            if m in result:
+                result.remove(m)
+            else:
+                result.add(m)
+
+    return frozenset(result)
+
+
+
+def _poly_to_anf(poly, index: dict) -> frozenset:
     if type(poly) is not Polynomial:
-        return poly
+        return _ONE_ANF if int(poly) % 2 else _ZERO_ANF
 
-    if type(poly[0]) is Polynomial:
-        poly = poly.map_coeffs(lambda i,c: (i, collapse_poly(c)))
+    var    = 1 << index[poly.symbol.repr]
+    result = set()
 
-    # Every degree > 1 is `x` AND `x`, AKA the identity!
-    # We can collapse the coefficients above degree 0 into a new degree 1
-    c1 = sum(list(poly >> 1))
-    c0 = poly[0]
+    for deg, coeff in enumerate(poly):
+        if not coeff:
+            continue
 
-    # This is about 2x as slow, but it handles when poly can't coerce c0 or c1
-    if poly.ring in (c0.ring, c1.ring) or c1.ring.is_superstructure_of(poly.ring) or c0.ring.is_superstructure_of(poly.ring):
-        result = c1*poly.symbol + c0
+        sub = _poly_to_anf(coeff, index)
+        if deg:
+            sub = {m | var for m in sub}
 
-        if result.degree() > 1:
-            result = collapse_poly(result)
-    else:
-        result = poly.ring([c0, c1])
+        result.symmetric_difference_update(sub)
+
+    return frozenset(result)
+
+
+
+def _anf_to_poly(anf: frozenset, ring, depth: int=None):
+    if type(ring) is not PolynomialRing:
+        return ring.one if anf else ring.zero
+
+    if not anf:
+        return ring.zero
+
+    # The outermost symbol is the highest parameter
+    if depth is None:
+        depth = len(_ring_params(ring))
+
+    var = 1 << (depth - 1)
+    c0  = frozenset(m for m in anf if not m & var)
+    c1  = frozenset(m ^ var for m in anf if m & var)
+
+    coeffs = [_anf_to_poly(c0, ring.ring, depth-1)]
+    if c1:
+        coeffs.append(_anf_to_poly(c1, ring.ring, depth-1))
+
+    return ring(coeffs)
+
+
+
+def _moebius(bits: int, n: int) -> int:
+    """
+    Fast Möbius transform over a packed table of `2**n` bits. It maps truth tables to ANF
+    coefficients and, being its own inverse over GF(2), back again.
+
+    References:
+        https://en.wikipedia.org/wiki/Algebraic_normal_form#Method_of_indeterminate_coefficients
+    """
+    full = (1 << (1 << n)) - 1
+    for i in range(n):
+        step = 1 << i
+
+        # Ones at every index with bit `i` clear
+        low   = ((1 << step) - 1) * (full // ((1 << (2*step)) - 1))
+        bits ^= (bits & low) << step
+
+    return bits
+
+
+
+def _pack_anf(anf: frozenset) -> int:
+    return sum(1 << m for m in anf)
+
+
+
+def _unpack_anf(bits: int) -> frozenset:
+    return frozenset(m for m in range(bits.bit_length()) if (bits >> m) & 1)
 
-    return result
 
 
 class SymBit(BaseObject):
-    def __init__(self, value) -> None:
-        self.value = collapse_poly(value)
+    """
+    Boolean function over GF(2) in algebraic normal form. `anf` is its set of monomials,
+    each a bitmask over the parameters of `ring`. The `Polynomial` is only built when
+    `value` is read.
+    """
+    def __init__(self, value=None, ring=None, anf: frozenset=None) -> None:
+        if anf is None:
+            if type(value) is Polynomial:
+                ring = value.ring
+                anf  = _poly_to_anf(value, {p: i for i, p in enumerate(_ring_params(ring))})
+            else:
+                anf = _ONE_ANF if int(value) % 2 else _ZERO_ANF
+
+        self.anf    = anf
+        self.ring   = ring
+        self._value = None
+        self._reconstructed = None
+
+
+    def __reprdir__(self):
+        return ['value']
+
+
+    @property
+    def value(self):
+        if self._value is None:
+            if self.ring is None:
+                self._value = _F2.one if self.anf else _F2.zero
+            else:
+                self._value = _anf_to_poly(self.anf, self.ring)
+
+        return self._value
+
+
+    def _join_ring(self, other):
+        return self.ring if self.ring is not None else other.ring
 
 
     def __call__(self, *args, **kwargs):
-        return SymBit(self.value(*args, **kwargs))
+        params = _ring_params(self.ring) if self.ring is not None else ()
+        kwargs.update(zip(params, args))
+
+        # Fully concrete calls only need the parity of the monomials left standing
+        if all(type(kwargs.get(name)) is int for name in params):
+            row = sum((kwargs[name] & 1) << i for i, name in enumerate(params))
+            on  = sum(1 for m in self.anf if not m & ~row) & 1
+            return SymBit(anf=_ONE_ANF if on else _ZERO_ANF)
+
+        ones  = 0
+        zeros = 0
+        subs  = {}
+        for i, name in enumerate(params):
+            if name not in kwargs:
+                continue
+
+            val = kwargs[name]
+            if type(val) is Polynomial:
+                val = SymBit(val)
+
+            if isinstance(val, SymBit):
+                if not val.is_constant():
+                    subs[i] = val
+                    continue
+
+                val = bool(val)
+
+            if int(val) % 2:
+                ones |= 1 << i
+            else:
+                zeros |= 1 << i
+
+
+        # Concrete values either kill a monomial or drop the variable from it
+        anf = self.anf
+        if ones or zeros:
+            result = set()
+            for m in anf:
+                if not m & zeros:
+                    m &= ~ones
+                    if m in result:
+                        result.remove(m)
+                    else:
+                        result.add(m)
+
+            anf = frozenset(result)
+
+
+        if subs:
+            ring   = next(iter(subs.values())).ring
+            index  = {p: i for i, p in enumerate(_ring_params(ring))}
+            result = set()
+
+            for m in anf:
+                term = _ONE_ANF
+                i    = 0
+                while m and term:
+                    if m & 1:
+                        factor = subs[i].anf if i in subs else frozenset([1 << index[params[i]]])
+                        term   = _anf_mul(term, factor)
+
+                    m >>= 1
+                    i  += 1
+
+                result.symmetric_difference_update(term)
+
+            anf = frozenset(result)
+
+        elif (ones | zeros) == (1 << len(params)) - 1:
+            ring = None
+
+        else:
+            ring = self.ring
+
+        return SymBit(ring=ring, anf=anf)
 
 
     def __and__(self, other):
+        # Plain ints fold without coercing them into a SymBit first
+        if type(other) is int:
+            return self if other & 1 else self._coerce(0)
+
         other = self._coerce(other)
-        return SymBit(self.value * other.value)
+        ring  = self._join_ring(other)
+
+        # Constant operands either absorb the other side or pass it through
+        if (not self.anf or other.anf == _ONE_ANF) and self.ring is ring:
+            return self
+
+        elif (not other.anf or self.anf == _ONE_ANF) and other.ring is ring:
+            return other
+
+        return SymBit(ring=ring, anf=_anf_mul(self.anf, other.anf))
 
 
     def __xor__(self, other):
+        if type(other) is int:
+            return ~self if other & 1 else self
+
         other = self._coerce(other)
-        return SymBit(self.value + other.value)
+        ring  = self._join_ring(other)
+
+        if not other.anf and self.ring is ring:
+            return self
+
+        elif not self.anf and other.ring is ring:
+            return other
+
+        return SymBit(ring=ring, anf=self.anf ^ other.anf)
 
 
     def __invert__(self):
-        return SymBit(self.value + 1)
+        return SymBit(ring=self.ring, anf=self.anf ^ _ONE_ANF)
 
 
     def __or__(self, other):
+        if type(other) is int:
+            return self._coerce(1) if other & 1 else self
+
         other = self._coerce(other)
-        return (self ^ other) ^ (self & other)
+        ring  = self._join_ring(other)
+
+        if (self.anf == _ONE_ANF or not other.anf) and self.ring is ring:
+            return self
+
+        elif (other.anf == _ONE_ANF or not self.anf) and other.ring is ring:
+            return other
+
+        # a | b == a ^ b ^ ab
+        return SymBit(ring=ring, anf=self.anf ^ other.anf ^ _anf_mul(self.anf, other.anf))
 
 
     def __eq__(self, other):
@@ -160,84 +436,103 @@ class SymBit(BaseObject):
 
 
     def is_constant(self):
-        return not bool(self.value[1]) and self.value[0] in (self.value.ring.zero, self.value.ring.one)
+        return self.anf in (_ZERO_ANF, _ONE_ANF)
  
 
     def __bool__(self):
-        return self.value.degree() == 0 and bool(self.value[0])
+        return self.anf == _ONE_ANF
 
 
     def __hash__(self):
-        return hash(self.value)
+        return hash(self.anf)
 
 
     def _coerce(self, other):
         if type(other) is int:
-            return SymBit(self.value.ring([other]))
+            return SymBit(ring=self.ring, anf=_ONE_ANF if other % 2 else _ZERO_ANF)
         else:
             return other
 
 
     def get_parameters(self):
-        curr   = self.value
-        params = []
-        while type(curr) is Polynomial:
-            params.append(curr.symbol.repr)
-            curr = curr[0]
-        
-        return params[::-1]
+        return list(_ring_params(self.ring)) if self.ring is not None else []
 
 
     def reconstruct(self):
-        params   = self.get_parameters()
-        body     = parse_poly(self.value, _OP_MAP_SYM)
-        params   = ', '.join(params)
-        filename = f'<dynamic-{Bytes.random(8).hex().decode()}>'
-
-        # Clean up function
-        if body[0] == '(' and body[-1] == ')':
-            body = body[1:-1]
-        
-        body = body.replace('& 1', '')
-        body = body.replace('~~', '')
+        # SymBits are immutable, so the compiled function can live on the instance
+        if getattr(self, '_reconstructed', None) is None:
+            func_name = self.func.__name__ if hasattr(self, 'func') else None
+            self._reconstructed = _compile_anf(tuple(self.get_parameters()), self.anf, func_name)
 
-        while '  ' in body:
-            body = body.replace('  ', ' ')
+        return self._reconstructed
 
 
-        if hasattr(self, 'func'):
-            func_name = self.func.__name__
-        else:
-            func_name = f'dynamic_{Bytes.random(8).hex().decode()}'
+    def build_output_table(self) -> 'IOTable':
+        params = tuple(self.get_parameters())
+        return IOTable(dict(_output_table(params, self.anf)), list(params))
 
-        source = f'def {func_name}({params}):\n    return {body}'
-        code   = compile(source, filename, 'exec')
 
-        l = {}
-        exec(code, {}, l)
 
-        lines = [line + '\n' for line in source.splitlines()]
+@RUNTIME.global_cache()
+def _compile_anf(params: tuple, anf: frozenset, func_name: str=None):
+    """
+    Compiles the function `anf` computes into Python. Cached so equal functions share the
+    compile, even across instances.
+    """
+    ring     = _build_symbols(params)[1].ring if params else _F2
+    body     = parse_poly(_anf_to_poly(anf, ring), _OP_MAP_SYM)
+    filename = f'<dynamic-{Bytes.random(8).hex().decode()}>'
 
-        linecache.cache[filename] = (len(source), None, lines, filename)
-        return l[func_name]
+    # Clean up function
+    if body[0] == '(' and body[-1] == ')':
+        body = body[1:-1]
 
+    body      = _CLEANUP.sub(_cleanup_run, body)
+    func_name = func_name or f'dynamic_{Bytes.random(8).hex().decode()}'
+    source    = f'def {func_name}({", ".join(params)}):\n    return {body}'
+    code      = compile(source, filename, 'exec')
 
-    def build_output_table(self) -> 'IOTable':
-        params = self.get_parameters()
-        table  = {}
-        for args in itertools.product(*[list(range(2)) for _ in range(len(params))]):
-            table[args] = self(**dict(zip(params, args)))
-        
-        return IOTable(table, self.get_parameters())
+    l = {}
+    exec(code, {}, l)
+
+    lines = [line + '\n' for line in source.splitlines()]
+
+    linecache.cache[filename] = (len(source), None, lines, filename)
+    return l[func_name]
+
+
+
+@RUNTIME.global_cache()
+def _output_table(params: tuple, anf: frozenset) -> dict:
+    # Evaluate every row at once: the Möbius transform of the ANF is the truth table
+    n     = len(params)
+    tt    = _moebius(_pack_anf(anf), n)
+    outs  = (SymBit(anf=_ZERO_ANF), SymBit(anf=_ONE_ANF))
+    table = {}
+
+    # Rows are keyed with the first parameter as the MSB, but it's bit 0 of the monomial masks
+    for idx in range(1 << n):
+        args = tuple((idx >> (n-1-j)) & 1 for j in range(n))
+        row  = sum(a << j for j, a in enumerate(args))
+        table[args] = outs[(tt >> row) & 1]
+
+    return table
 
 
 
 def build_symbols(parameters: list) -> tuple:
+    symbols, zero, one = _build_symbols(tuple(parameters))
+    return list(symbols), zero, one
+
+
+
+@RUNTIME.global_cache()
+def _build_symbols(parameters: tuple) -> tuple:
+    # SymBits are immutable, so callers with the same parameters can share them
     symbols = tuple([Symbol(param) for param in parameters])
-    R = ZZ/ZZ(2)
-    P = R[symbols]
+    P = _F2[symbols]
 
-    return [SymBit(P(sym)) for sym in symbols], SymBit(P.zero), SymBit(P.one)
+    return tuple([SymBit(P(sym)) for sym in symbols]), SymBit(P.zero), SymBit(P.one)
 
 
 
@@ -268,31 +563,31 @@ class IOTable(BaseObject):
 
 
     def build_symbit(self) -> 'Symbit':
-        symbols, zero, one = build_symbols(self.symbols)
-        func = zero
+        _symbols, zero, _one = build_symbols(self.symbols)
 
+        # Pack the table with row `k` at the monomial mask of its ones
+        tt = 0
         for k,v in self.table.items():
-            curr = one
             if v:
-                for sym, val in zip(symbols, k):
-                    if not val:
-                        sym = ~sym
-                    
-                    curr &= sym
-                
-                func ^= curr
-        
-        return func
+                tt |= 1 << sum(val << i for i, val in enumerate(k))
+
+        return SymBit(ring=zero.ring, anf=_unpack_anf(_moebius(tt, len(self.symbols))))
 
 
     def serialize(self) -> Bytes:
-        out_string = [None] * len(self.table)
+        # Row `pos` goes to bit `pos` counting from the MSB of a `len(table)`-bit int
+        size   = len(self.table)
+        packed = 0
 
         for in_args, output in self.table.items():
-            pos = int(''.join([str(a) for a in in_args]), 2)
-            out_string[pos] = int(output)
+            pos = 0
+            for a in in_args:
+                pos = (pos << 1) | a
+
+            if output:
+                packed |= 1 << (size - 1 - pos)
 
-        return Bytes(len(self.symbols)) + Bytes(int(''.join([str(b) for b in out_string]), 2))
+        return Bytes(len(self.symbols)) + Bytes(packed)
 
 
     @staticmethod
@@ -300,9 +595,16 @@ class IOTable(BaseObject):
         import string
         num_args = in_bytes[0]
         symbols  = string.ascii_letters[:num_args]
-        outputs  = [int(b) for b in bin(Bytes.wrap(in_bytes[1:]).int())[2:].zfill(len(symbols))]
+        packed   = int.from_bytes(in_bytes[1:], 'big')
+        size     = 1 << num_args
 
-        return IOTable({tuple([int(b) for b in bin(i)[2:].zfill(len(symbols))]): o for i,o in enumerate(outputs)}, list(symbols))
+        # Row `i` is bit `i` counting from the MSB, as written by `serialize`
+        table = {}
+        for i in range(size):
+            args        = tuple((i >> (num_args-1-j)) & 1 for j in range(num_args))
+            table[args] = (packed >> (size-1-i)) & 1
+
+        return IOTable(table, list(symbols))
 
 
 
@@ -315,6 +617,12 @@ class SymFunc(SymBit):
         self.one = one
         self.symbolic = symbolic
 
+        # Concrete calls just look up their row
+        if isinstance(symbolic, SymBit):
+            self._truth_table = _moebius(_pack_anf(symbolic.anf), len(symbols))
+        else:
+            self._truth_table = None
+
 
     @staticmethod
     def from_func(func):
@@ -326,18 +634,61 @@ class SymFunc(SymBit):
 
     def __call__(self, *args, **kwargs):
         bound = self.sig.bind(*args, **kwargs)
+        vals  = list(bound.arguments.values())
+
+        if self._truth_table is not None and len(vals) == len(self.symbols) and all(type(v) is int for v in vals):
+            row = sum((v & 1) << i for i, v in enumerate(vals))
+            return SymBit(anf=_ONE_ANF if (self._truth_table >> row) & 1 else _ZERO_ANF)
+
         return self.symbolic(**bound.arguments)
 
 
+    def __reprdir__(self):
+        return ['func', 'sig', 'symbols', 'zero', 'one', 'symbolic']
+
+
     @property
     def value(self):
         return self.symbolic.value
 
 
+    @property
+    def anf(self):
+        return self.symbolic.anf
+
+
+    @property
+    def ring(self):
+        return self.symbolic.ring
+
+
+
+def _truth_table(func, num_args: int) -> int:
+    """
+    Packs the outputs of `func` with the row for `args` at bit `sum(a << j)`.
+    """
+    if type(func) is SymFunc and func._truth_table is not None and len(func.symbols) == num_args:
+        return func._truth_table
+
+    tt = 0
+    for row in range(1 << num_args):
+        args = tuple((row >> j) & 1 for j in range(num_args))
+        if bool(func(*args) & 1):
+            tt |= 1 << row
+
+    return tt
+
+
 
 def check_equiv(func1, func2, num_args):
-    for args in itertools.product(*[list(range(2)) for _ in range(num_args)]):
-        if (func1(*args) & 1) != (func2(*args) & 1):
+    # SymFuncs already carry their truth tables, so only the rows that differ are visited
+    diff = _truth_table(func1, num_args) ^ _truth_table(func2, num_args)
+    if not diff:
+        return
+
+    for idx in range(1 << num_args):
+        args = tuple((idx >> (num_args-1-j)) & 1 for j in range(num_args))
+        if (diff >> sum(a << j for j, a in enumerate(args))) & 1:
             print(args)
 
 
@@ -359,8 +710,13 @@ class SymbolSet(BaseObject):
     def __init__(self, symbol_names, size) -> None:
         self.vars = [[Symbol(f'{var}{i}') for i in range(size)] for var in symbol_names]
         symbols   = tuple([item for b in self.vars for item in b])
-        self.R    = ZZ/ZZ(2)
+        self.R    = _F2
         self.P    = self.R[symbols]
+
+        # Name lookups for `FixedBitVector.__call__`
+        size_len    = len(str(size))
+        self.names  = set(v.repr for l in self.vars for v in l)
+        self.by_var = {v.repr[:-size_len]:l for l in self.vars for v in l}
     
 
     def __iter__(self):
@@ -375,6 +731,9 @@ class SymbolSet(BaseObject):
 class FixedBitVector(BaseObject):
     SIZE = None
 
+    # Value of vectors built by `_coerce(int)`, so constant ops skip their symbols
+    _const_int = None
+
     def __init__(self, var, symbol_set) -> None:
         self.var_name = var
         self.vars = symbol_set
@@ -386,28 +745,27 @@ class FixedBitVector(BaseObject):
 
     @property
     def zero(self):
-        return SymBit(self.symbols[0].value.coeff_ring.zero)
+        return self.symbols[0]._coerce(0)
 
 
     @property
     def one(self):
-        return SymBit(self.symbols[0].value.coeff_ring.one)
+        return self.symbols[0]._coerce(1)
 
 
-    def __call__(self, *vals, **kwargs):
-        size_len = len(str(self.SIZE))
-        v_names  = set(v.repr for l in self.vars for v in l)
-        v_map    = {v.repr[:-size_len]:l for l in self.vars for v in l}
-        val_dict = {}
+    @staticmethod
+    def _val_to_dict(size, var, val):
+        val %= 2**size
+        return {s.repr:(val >> i) & 1 for i, s in enumerate(var)}
 
-        def val_to_dict(var, val):
-            val %= 2**self.SIZE
-            args = [int(b) for b in bin(val)[2:].zfill(self.SIZE)]
-            return {s.repr:v for s,v in zip(var, args[::-1])}
 
+    def __call__(self, *vals, **kwargs):
+        v_names  = self.vars.names
+        v_map    = self.vars.by_var
+        val_dict = {}
 
         for var, val in zip(self.vars, vals):
-            val_dict.update(val_to_dict(var, val))
+            val_dict.update(self._val_to_dict(self.SIZE, var, val))
 
 
         for var, val in kwargs.items():
@@ -420,43 +778,70 @@ class FixedBitVector(BaseObject):
                 
                 # Handle unwrapping concrete values like a=7
                 else:
-                    val_dict.update(val_to_dict(v_map[var], val))
+                    val_dict.update(self._val_to_dict(self.SIZE, v_map[var], val))
 
 
-        # Strip symbits
-        for k,v in val_dict.items():
-            if type(v) is SymBit:
-                val_dict[k] = v.value
+        if all(type(v) is int for v in val_dict.values()):
+            bv = self._eval_concrete(val_dict)
+            if bv is not None:
+                return bv
 
-        binary = [SymBit(a(**val_dict).value) for a in self.symbols]
+        binary = [a(**val_dict) for a in self.symbols]
 
-        bv = self._create_copy()
+        bv = self._empty_like()
         bv.symbols = binary
         return bv
+
+
+    def _eval_concrete(self, val_dict: dict):
+        """
+        Evaluates every bit at the concrete assignment `val_dict`. Bits sharing a ring
+        share the row, so each is just a parity check. Returns None if `val_dict` doesn't
+        cover every parameter.
+        """
+        rows = {}
+        acc  = 0
+        for s in self.symbols:
+            key = id(s.ring)
+            if key not in rows:
+                params = _ring_params(s.ring)
+                if not all(p in val_dict for p in params):
+                    return None
+
+                rows[key] = sum((val_dict[p] & 1) << i for i, p in enumerate(params))
+
+            row = rows[key]
+            acc = (acc << 1) | (sum(1 for m in s.anf if not m & ~row) & 1)
+
+
+        outs = (SymBit(anf=_ZERO_ANF), SymBit(anf=_ONE_ANF))
+        bv   = self._empty_like()
+        bv.symbols    = [outs[(acc >> i) & 1] for i in range(self.SIZE-1, -1, -1)]
+        bv._const_int = acc
+        return bv
     
 
     def solve(self, bits: List[SolveFor], ignore: list=None):
         if type(bits) is int:
-            bits = [int(b) for b in bin(bits)[2:].zfill(self.SIZE)]
+            bits = [(bits >> i) & 1 for i in range(self.SIZE-1, -1, -1)]
 
         return bv_process(self, bits)
 
 
     def is_constant(self):
-        for s in self.symbols:
-            curr = s.value
-            while type(curr.ring) is PolynomialRing:
-                if curr.degree():
-                    return False
-                
-                curr = curr[0]
-    
-        return True
+        return self._const_int is not None or all(s.is_constant() for s in self.symbols)
     
 
     def int(self):
-        if self.is_constant():
-            return int(''.join(str(int(b.value if hasattr(b, 'value') else b.val)) for b in self.symbols), 2)
+        if self._const_int is not None:
+            return self._const_int
+
+        elif self.is_constant():
+            acc = 0
+            for b in self.symbols:
+                acc = (acc << 1) | bool(b)
+
+            return acc
         else:
             raise ValueError("BitVector is not constant")
 
@@ -474,17 +859,29 @@ class FixedBitVector(BaseObject):
         bv = self.__class__(self.var_name, self.vars)
         bv.symbols = [s for s in self.symbols]
         return bv
+
+
+    def _empty_like(self):
+        """
+        Same as `_create_copy` minus `symbols`, for callers that assign their own.
+        """
+        bv = object.__new__(self.__class__)
+        bv.var_name = self.var_name
+        bv.vars = self.vars
+        return bv
     
     
     def _coerce(self, other: int):
         if type(other) is int:
-            bv = self._create_copy()
+            bv = self._empty_like()
             other %= 2**self.SIZE
-            bv.symbols = [self.one if int(b) else self.zero for b in bin(other)[2:].zfill(self.SIZE)]
+            one, zero  = self.one, self.zero
+            bv.symbols = [one if (other >> i) & 1 else zero for i in range(self.SIZE-1, -1, -1)]
+            bv._const_int = other
             return bv
 
         elif type(other) is SymBit:
-            bv = self._create_copy()
+            bv = self._empty_like()
             bv.symbols = [self.zero]*(self.SIZE-1) + [other]
             return bv
 
@@ -497,53 +894,124 @@ class FixedBitVector(BaseObject):
             return other
     
 
+    def _both_const(self, other) -> bool:
+        return self._const_int is not None and getattr(other, '_const_int', None) is not None
+
+
+    def _const_op(self, other, if_set, if_clear):
+        """
+        Applies a bitwise op against a concrete `other` lane by lane, without building its
+        symbols. `if_set` and `if_clear` give the result lane for a set and clear bit.
+        Returns None if `other` is symbolic.
+        """
+        if type(other) is int:
+            val = other % 2**self.SIZE
+        else:
+            val = getattr(other, '_const_int', None)
+            if val is None:
+                return None
+
+        size = self.SIZE
+        bv   = self._empty_like()
+        bv.symbols = [if_set(s) if (val >> (size-1-i)) & 1 else if_clear(s) for i, s in enumerate(self.symbols)]
+        return bv
+
+
     def __lshift__(self, idx):
-        bv = self._create_copy()
-        bv.symbols.extend([bv.zero]*idx)
-        bv.symbols = bv.symbols[-self.SIZE:]
+        if self._const_int is not None:
+            return self._coerce(self._const_int << idx)
+
+        # One slice plus the zero fill, MSB first
+        idx = min(idx, self.SIZE)
+        bv  = self._empty_like()
+        bv.symbols = self.symbols[idx:] + [self.zero]*idx
         return bv
 
 
 
     def __rshift__(self, idx):
-        bv = self._create_copy()
-        bv.symbols = ([bv.zero]*idx) + bv.symbols
-        bv.symbols = bv.symbols[:self.SIZE]
+        if self._const_int is not None:
+            return self._coerce(self._const_int >> idx)
+
+        idx = min(idx, self.SIZE)
+        bv  = self._empty_like()
+        bv.symbols = [self.zero]*idx + self.symbols[:self.SIZE-idx]
         return bv
 
 
     def __xor__(self, other):
-        bv = self._create_copy()
+        # A concrete side only selects per lane, so the symbolic side does the work
+        if self._const_int is not None and isinstance(other, FixedBitVector) and other._const_int is None:
+            return other ^ self
+
+        elif self._const_int is None:
+            bv = self._const_op(other, lambda s: ~s, lambda s: s)
+            if bv is not None:
+                return bv
+
         other = self._coerce(other)
+        if self._both_const(other):
+            return self._coerce(self._const_int ^ other._const_int)
 
+        bv = self._empty_like()
         bv.symbols = [a^b for a,b in zip(self.symbols, other.symbols)]
         return bv
 
 
     def __and__(self, other):
-        bv = self._create_copy()
+        if self._const_int is not None and isinstance(other, FixedBitVector) and other._const_int is None:
+            return other & self
+
+        elif self._const_int is None:
+            zero = self.zero
+            bv   = self._const_op(other, lambda s: s, lambda s: zero)
+            if bv is not None:
+                return bv
+
         other = self._coerce(other)
+        if self._both_const(other):
+            return self._coerce(self._const_int & other._const_int)
+
+        bv = self._empty_like()
         bv.symbols = [a&b for a,b in zip(self.symbols, other.symbols)]
         return bv
 
 
     def __or__(self, other):
-        bv = self._create_copy()
+        if self._const_int is not None and isinstance(other, FixedBitVector) and other._const_int is None:
+            return other | self
+
+        elif self._const_int is None:
+            one = self.one
+            bv  = self._const_op(other, lambda s: one, lambda s: s)
+            if bv is not None:
+                return bv
+
         other = self._coerce(other)
+        if self._both_const(other):
+            return self._coerce(self._const_int | other._const_int)
+
+        bv = self._empty_like()
         bv.symbols = [a|b for a,b in zip(self.symbols, other.symbols)]
         return bv
 
 
     def __eq__(self, other):
-        bv = self._create_copy()
         other = self._coerce(other)
+        if self._both_const(other):
+            return self._coerce(~(self._const_int ^ other._const_int))
+
+        bv = self._empty_like()
         bv.symbols = [a==b for a,b in zip(self.symbols, other.symbols)]
         return bv
 
 
     def __invert__(self):
-        bv = self._create_copy()
-        bv.symbols = [~s for s in bv.symbols]
+        if self._const_int is not None:
+            return self._coerce(~self._const_int)
+
+        bv = self._empty_like()
+        bv.symbols = [~s for s in self.symbols]
         return bv
 
 
@@ -643,6 +1111,92 @@ class ALU(BaseObject):
 
 
 
+class _ConcreteVector(object):
+    """
+    Native int stand-in for a constant `FixedBitVector`, so `ADVOP` algorithms
+    run on machine words instead of symbolic bits.
+    """
+    __slots__ = ('val', 'SIZE')
+
+    def __init__(self, val: int, size: int) -> None:
+        self.val  = val % 2**size
+        self.SIZE = size
+
+
+    def _coerce(self, other):
+        if type(other) is int:
+            return _ConcreteVector(other, self.SIZE)
+        else:
+            return other
+
+
+    def __lshift__(self, idx):
+        return _ConcreteVector(self.val << idx, self.SIZE)
+
+
+    def __rshift__(self, idx):
+        return _ConcreteVector(self.val >> idx, self.SIZE)
+
+
+    def __xor__(self, other):
+        return _ConcreteVector(self.val ^ self._coerce(other).val, self.SIZE)
+
+
+    def __and__(self, other):
+        return _ConcreteVector(self.val & self._coerce(other).val, self.SIZE)
+
+
+    def __or__(self, other):
+        return _ConcreteVector(self.val | self._coerce(other).val, self.SIZE)
+
+
+    def __eq__(self, other):
+        return ~(self ^ other)
+
+
+    def __invert__(self):
+        return _ConcreteVector(~self.val, self.SIZE)
+
+
+    def __matmul__(self, other):
+        return ~self | other
+
+
+
+def _concrete_fast_path(func):
+    """
+    Runs `func` on native ints when every `FixedBitVector` argument is constant.
+    Results are converted back with the first vector's `_coerce`.
+    """
+    def _unwrap(val, template):
+        if type(val) is _ConcreteVector:
+            return template._coerce(val.val)
+
+        elif type(val) in (list, tuple):
+            return type(val)(_unwrap(v, template) for v in val)
+
+        else:
+            return val
+
+
+    @wraps(func)
+    def _wrapper(*args, **kwargs):
+        vecs = [a for a in (*args, *kwargs.values()) if isinstance(a, FixedBitVector)]
+
+        if not vecs or not all(a.is_constant() for a in vecs):
+            return func(*args, **kwargs)
+
+        def _concrete(a):
+            return _ConcreteVector(a.int(), a.SIZE) if isinstance(a, FixedBitVector) else a
+
+        args   = [_concrete(a) for a in args]
+        kwargs = {k: _concrete(v) for k, v in kwargs.items()}
+        return _unwrap(func(*args, **kwargs), vecs[0])
+
+    return _wrapper
+
+
+
 class ADVOP:
     def TWO_CMPT(a):
         """Two's complement"""
@@ -650,12 +1204,17 @@ class ADVOP:
         return ADVOP.ADD(a ^ m, 1)
 
 
+    @_concrete_fast_path
     def NZTRANS(a):
         """Transforms non-zero bitvectors to ALL ones"""
-        for i in range(a.SIZE.bit_length()-1):
+        if type(a) is _ConcreteVector:
+            return a._coerce(-1 if a.val else 0)
+
+        # Enough doublings to span SIZE-1 bits, including non-power-of-two sizes
+        for i in range((a.SIZE-1).bit_length()):
             a |= a >> 2**i
 
-        for i in range(a.SIZE.bit_length()-1):
+        for i in range((a.SIZE-1).bit_length()):
             a |= a << 2**i
 
         return a
@@ -677,7 +1236,13 @@ class ADVOP:
         return s2, c2 | c1
 
 
+    @_concrete_fast_path
     def ADD_CARRY(a, b, c):
+        # Concrete operands add natively instead of one full adder per bit
+        if type(a) is _ConcreteVector:
+            total = a.val + a._coerce(b).val + (0 if c is None else a._coerce(c).val)
+            return a._coerce(total), a._coerce(total >> a.SIZE)
+
         s, c = a ^ a, a ^ a if c is None else c
         for i in range(a.SIZE):
             a_bit = (a >> i) & 1
@@ -688,55 +1253,51 @@ class ADVOP:
         return s, c
 
 
+    @_concrete_fast_path
     def ADD(a, b, c=None):
         s, c = ADVOP.ADD_CARRY(a, b, None)
         return s ^ (c << a.SIZE)
 
 
+    @_concrete_fast_path
     def SUB(a, b):
         return ADVOP.ADD(a, ADVOP.TWO_CMPT(b))
 
 
+    @_concrete_fast_path
     def MUL(a, b):
         """
+        Wallace tree multiplier. Returns the product mod 2**SIZE.
+
         References:
-            https://en.wikipedia.org/wiki/Booth%27s_multiplication_algorithm
+            https://en.wikipedia.org/wiki/Wallace_tree
         """
-        # Initialize Booth's algorithm
-        zero  = a._coerce(0)
-        size  = a.SIZE
-        A_hi  = a
-        A_mid = zero
-        A_low = zero
+        if type(a) is _ConcreteVector:
+            return a._coerce(a.val * a._coerce(b).val)
 
-        S_hi  = ADVOP.TWO_CMPT(a)
-        S_mid = zero
-        S_low = zero
+        # Partial product `i` is `a` masked by bit `i` of `b`
+        size = a.SIZE
+        rows = []
+        for i in range(size):
+            b_bit = b[size-1-i]
+            rows.append(a._coerce([s & b_bit for s in a.symbols]) << i)
 
-        P_hi  = zero
-        P_mid = b
-        P_low = zero
 
-        for _ in range(size):
-            b0 = ADVOP.TESTBIT(P_mid, 0)
-            b1 = ADVOP.TESTBIT(P_low, size-1)
+        # Reduce three rows to two with carry-save adders until two are left
+        while len(rows) > 2:
+            reduced = []
+            for j in range(0, len(rows) - 2, 3):
+                s, c = ADVOP.FULL_ADDER(*rows[j:j+3])
+                reduced.extend([s, c << 1])
 
-            P  = [P_hi, P_mid, P_low]
-            PS = ADVOP.MP_ADD(P, (S_hi, S_mid, S_low))
-            PA = ADVOP.MP_ADD(P, (A_hi, A_mid, A_low))
+            reduced.extend(rows[len(rows) - len(rows) % 3:])
+            rows = reduced
 
-            b01 = b0 ^ b1
-            P[0] = ADVOP.IFNZ(b01, ADVOP.IFNZ(b0, PS[0], PA[0]), P[0])
-            P[1] = ADVOP.IFNZ(b01, ADVOP.IFNZ(b0, PS[1], PA[1]), P[1])
-            P[2] = ADVOP.IFNZ(b01, ADVOP.IFNZ(b0, PS[2], PA[2]), P[2])
 
-            P_hi, P_mid, P_low = P
-            P_low  = (P_mid & 1) << (size-1)
-            P_mid  = (P_mid >> 1) ^ ((P_hi & 1) << (size-1))
-            P_hi >>= 1
+        if len(rows) == 1:
+            return rows[0]
 
-
-        return P_mid
+        return ADVOP.ADD(*rows)
 
     
 
@@ -745,6 +1306,7 @@ class ADVOP:
 
 
 
+    @_concrete_fast_path
     def DIV(a, b):
         """
         https://iq.opengenus.org/bitwise-division/
@@ -784,7 +1346,7 @@ class ADVOP:
 
     def S_GT(a, b):
         diff = a ^ b
-        for i in range(a.SIZE.bit_length()-1):
+        for i in range((a.SIZE-1).bit_length()):
             diff |= diff >> 2**i
 
         m1 = 1 << (a.SIZE-1)
@@ -796,20 +1358,23 @@ class ADVOP:
         return diff
 
 
+    @_concrete_fast_path
     def GT(a, b):
         ltb = ~a & b
         gtb = a & ~b
 
-        for i in range(a.SIZE.bit_length()-1):
+        for i in range((a.SIZE-1).bit_length()):
             ltb |= ltb >> 2**i
         
         return gtb & ~ltb
 
 
+    @_concrete_fast_path
     def LT(a, b):
         return ~(a == b) & ~ADVOP.NZTRANS(ADVOP.GT(a, b))
     
 
+    @_concrete_fast_path
     def EQ(a, b):
         return ~ADVOP.NZTRANS(a ^ b)
 
@@ -852,6 +1417,46 @@ class ADVOP:
 
 
 
+def _constant_value(val, size: int):
+    """
+    Returns `val` reduced to `size` bits if it's concrete, else None.
+    """
+    if type(val) is int:
+        return val % 2**size
+
+    elif isinstance(val, FixedBitVector) and val.is_constant():
+        return val.int()
+
+    return None
+
+
+
+def _mux_tree(index, leaves: list):
+    """
+    Selects `leaves[index]` with a balanced tree of muxes over the bits of `index`,
+    so the depth is logarithmic in `len(leaves)`. Out of range indices select zero.
+    """
+    zero  = index ^ index
+    level = [index._coerce(leaf) for leaf in leaves] or [zero]
+    bit   = 0
+
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(zero)
+
+        # Every mux on this level shares the same select bit
+        mask  = ADVOP.NZTRANS((index >> bit) & 1)
+        inv   = ~mask
+        level = [(mask & level[j+1]) ^ (inv & level[j]) for j in range(0, len(level), 2)]
+        bit  += 1
+
+    if bit < index.SIZE:
+        return ADVOP.IFNZ(index >> bit, zero, level[0])
+
+    return level[0]
+
+
+
 class LUT(BaseObject):
     def __init__(self, table=None) -> None:
         self.table = table or []
@@ -866,6 +1471,17 @@ class LUT(BaseObject):
 
 
     def __getitem__(self, k):
+        keys = [_constant_value(key, k.SIZE) for key, _val in self.table]
+
+        # Dense tables of constant keys index like a list. Later entries win, as in the scan.
+        if keys and None not in keys and 1 << max(keys).bit_length() <= 2*len(keys):
+            leaves = [0] * (1 << max(keys).bit_length())
+            for key, (_key, val) in zip(keys, self.table):
+                leaves[key] = val
+
+            return _mux_tree(k, leaves)
+
+
         c = k ^ k
         for key, val in self.table:
             c = ADVOP.IFNZ(k ^ key, c, val)
@@ -892,11 +1508,7 @@ class SymList(BaseObject):
 
 
     def __getitem__(self, other):
-        c = other ^ other
-        for idx, v in enumerate(self.val):
-            c = ADVOP.IFNZ(other ^ idx, c, v)
-
-        return c
+        return _mux_tree(other, self.val)
 
 
     def index(self, other):
@@ -1,5 +1,6 @@
 from types import FunctionType
 from samson.utilities.bytes import Bytes
+from samson.utilities.manipulation import xor_buffs
 from samson.core.primitives import MAC, BlockCipher, Primitive, StreamCipher
 from samson.core.metadata import SizeType, SizeSpec
 from samson.ace.decorators import register_primitive
@@ -22,7 +23,7 @@ class BEAR(BlockCipher):
         self.key_schedule = key_schedule
 
         self.K1, self.K2 = self.key_schedule(self.key)
-        self.k = len(self.H(b'\x00').generate(b'\x00')) 
+        self.k = len(self.H(b'\x00').generate(b'\x00')) * 8
     
 
 
@@ -30,12 +31,13 @@ class BEAR(BlockCipher):
         Ls = self.k // 8
         Rs = max((self.block_size - self.k) // 8, 0)
 
-        L, R = plaintext[:Ls], plaintext[Ls:]
-        L ^= self.H(self.K1).generate(R)
-        R ^= self.S(L).generate(Rs)
-        L ^= self.H(self.K2).generate(R)
+        # Both halves are XOR'd in place in a single buffer
+        out = bytearray(plaintext)
+        out[:Ls] = xor_buffs(out[:Ls], self.H(self.K1).generate(Bytes(out[Ls:])))
+        out[Ls:] = xor_buffs(out[Ls:], self.S(Bytes(out[:Ls])).generate(Rs))
+        out[:Ls] = xor_buffs(out[:Ls], self.H(self.K2).generate(Bytes(out[Ls:])))
 
-        return L + R
+        return Bytes(out)
 
 
 
@@ -43,9 +45,9 @@ class BEAR(BlockCipher):
         Ls = self.k // 8
         Rs = max((self.block_size - self.k) // 8, 0)
 
-        L, R = ciphertext[:Ls], ciphertext[Ls:]
-        L ^= self.H(self.K2).generate(R)
-        R ^= self.S(L).generate(Rs)
-        L ^= self.H(self.K1).generate(R)
+        out = bytearray(ciphertext)
+        out[:Ls] = xor_buffs(out[:Ls], self.H(self.K2).generate(Bytes(out[Ls:])))
+        out[Ls:] = xor_buffs(out[Ls:], self.S(Bytes(out[:Ls])).generate(Rs))
+        out[:Ls] = xor_buffs(out[:Ls], self.H(self.K1).generate(Bytes(out[Ls:])))
 
-        return L + R
+        return Bytes(out)
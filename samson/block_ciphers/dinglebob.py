@@ -17,24 +17,27 @@ def build_dinglebob(SIZE, HASH=None, ROUNDS=16, SUBKEY_SIZE=512):
 
 
     def cut_to_bitsize(b, size):
-        modulus = 2**size
-        q = b
-        results = []
+        # Most significant chunk first; leading zero chunks are dropped
+        num_chunks = -(-b.bit_length() // size)
 
-        while q:
-            q, r = divmod(q, modulus)
-            results.append(r)
+        if size % 8:
+            mask = 2**size - 1
+            return [(b >> (size*i)) & mask for i in range(num_chunks-1, -1, -1)]
 
-        return results[::-1]
+        chunk = size // 8
+        raw   = b.to_bytes(num_chunks*chunk, 'big')
+        return [int.from_bytes(raw[i:i+chunk], 'big') for i in range(0, len(raw), chunk)]
 
 
     def to_feistel_native(b):
-        return Bytes.wrap(b''.join([Bytes(r).zfill(INTERNAL_HALF) for r in cut_to_bitsize(b.int(), SIZE_HALF)])).zfill(math.ceil(SIZE / 16)*2)
+        # Each SIZE_HALF-bit half gets its own INTERNAL_HALF bytes
+        x = b.int()
+        return Bytes(int.to_bytes(x >> SIZE_HALF, INTERNAL_HALF, 'big') + int.to_bytes(x & MASK, INTERNAL_HALF, 'big'))
 
 
     def from_feistel_native(b):
         half = len(b) // 2
-        return Bytes(b[:half].int() * 2**SIZE_HALF + b[half:].int())
+        return Bytes(int.to_bytes(b[:half].int() << SIZE_HALF | b[half:].int(), SIZE_BYTES, 'big'))
 
 
 
@@ -43,11 +46,20 @@ def build_dinglebob(SIZE, HASH=None, ROUNDS=16, SUBKEY_SIZE=512):
 
 
     def key_schedule(key):
-        keys = HKDF(HASH, (SUBKEY_SIZE*ROUNDS) // 8).derive(key, salt=f'{SIZE}-bit cipher'.encode('utf-8')).int()
-        n    = keys.bit_length()
-
-        for i in range(n // SUBKEY_SIZE):
-            yield (keys >> SUBKEY_SIZE*i) % 2**SUBKEY_SIZE
+        keys = HKDF(HASH, (SUBKEY_SIZE*ROUNDS) // 8).derive(key, salt=f'{SIZE}-bit cipher'.encode('utf-8'))
+        n    = keys.int().bit_length()
+
+        # Subkeys are read from the least significant end. Slice whole-byte subkeys
+        # out directly rather than shifting the full derivation for each one.
+        if SUBKEY_SIZE % 8:
+            keys = keys.int()
+            for i in range(n // SUBKEY_SIZE):
+                yield (keys >> SUBKEY_SIZE*i) % 2**SUBKEY_SIZE
+        else:
+            chunk = SUBKEY_SIZE // 8
+            end   = len(keys)
+            for i in range(n // SUBKEY_SIZE):
+                yield int.from_bytes(keys[end-(i+1)*chunk:end-i*chunk], 'big')
 
 
     def generate_whiteners(key):
@@ -65,7 +77,8 @@ def build_dinglebob(SIZE, HASH=None, ROUNDS=16, SUBKEY_SIZE=512):
 
         def __init__(self, key):
             self.key         = key
-            self.network     = FeistelNetwork(round_func, key_schedule)
+            self.subkeys     = list(key_schedule(key))
+            self.network     = FeistelNetwork(round_func, lambda key: self.subkeys)
             self.block_size  = self.BLOCK_SIZE
             self.w0, self.w1 = generate_whiteners(key)
 
@@ -1,6 +1,6 @@
 from samson.constructions.feistel_network import FeistelNetwork
 from samson.utilities.bytes import Bytes
-from samson.encoding.general import int_to_bytes, bytes_to_bitstring
+from samson.encoding.general import int_to_bytes
 from samson.core.primitives import BlockCipher, Primitive
 from samson.core.metadata import SizeType, SizeSpec, UsageType
 from samson.ace.decorators import register_primitive
@@ -73,58 +73,94 @@ def key_schedule(key):
     return round_keys
 
 
-def round_func(R_i, K_i):
+def _rol16(x: int, n: int) -> int:
+    return ((x << n) | (x >> (16 - n))) & 0xFFFF
+
+
+# The cipher's arithmetic runs on plain ints (16-bit halves, 32-bit words).
+# The `Bytes` functions below only convert at the edges.
+def _fi(x: int, k: int) -> int:
+    l, r     = x >> 7, x & 0b1111111
+    k_l, k_r = k >> 9, k & 0b111111111
+
+    l_1, r_1 = r, S9[l] ^ r
+
+    l_2 = r_1 ^ k_r
+    r_2 = S7[l_1] ^ (r_1 & 0b1111111) ^ k_l
+
+    r_3 = S9[l_2] ^ r_2
+    l_3 = S7[r_2] ^ (r_3 & 0b1111111)
+
+    return l_3 << 9 | r_3
+
+
+def _fo(KO_i, KI_i, x: int) -> int:
+    l, r = x >> 16, x & 0xFFFF
+
+    # Some sort of deranged Feistel network...
+    for i in range(3):
+        l, r = r, _fi(l ^ KO_i[i], KI_i[i]) ^ r
+
+    return l << 16 | r
+
+
+def _fl(KL_i, x: int) -> int:
+    l, r = x >> 16, x & 0xFFFF
+
+    r ^= _rol16(l & KL_i[0], 1)
+    l ^= _rol16(r | KL_i[1], 1)
+
+    return l << 16 | r
+
+
+def _round_func(x: int, K_i) -> int:
     KL_i = K_i[:2]
     KO_i = K_i[2:5]
     KI_i = K_i[5:8]
-    counter = K_i[-1]
-
 
-    if counter % 2 == 1:
-        state  = fun_fl(KL_i, R_i)
-        output = fun_fo(KO_i, KI_i, state)
+    if K_i[-1] % 2 == 1:
+        return _fo(KO_i, KI_i, _fl(KL_i, x))
     else:
-        state  = fun_fo(KO_i, KI_i, R_i)
-        output = fun_fl(KL_i, state)
+        return _fl(KL_i, _fo(KO_i, KI_i, x))
 
-    return output
 
+def _to_ints(keys) -> list:
+    return [int.from_bytes(k, 'big') for k in keys]
 
-def fun_fl(KL_i, x):
-    l, r = x.chunk(2)
 
-    r_prime = (l & KL_i[0]).lrot(1) ^ r
-    l_prime = (r_prime | KL_i[1]).lrot(1) ^ l
+def _int_round_keys(round_keys) -> list:
+    return [_to_ints(K_i[:8]) + [K_i[-1]] for K_i in round_keys]
 
-    return l_prime + r_prime
 
+def _encrypt_block(l: int, r: int, round_keys) -> tuple:
+    for K_i in round_keys:
+        l, r = r ^ _round_func(l, K_i), l
 
-def fun_fi(K_i, x):
-    as_bin = bytes_to_bitstring(x)
-    l, r = int(as_bin[:9], 2), int(as_bin[9:], 2)
+    return l, r
 
-    K_int = int.from_bytes(K_i, 'big')
-    K_l, K_r = K_int >> 9, K_int & 0b111111111
 
-    l_1, r_1 = r, S9[l] ^ r
+def _decrypt_block(l: int, r: int, round_keys) -> tuple:
+    for K_i in reversed(round_keys):
+        l, r = r, l ^ _round_func(r, K_i)
 
-    l_2 = r_1 ^ K_r
-    r_2 = S7[l_1] ^ (r_1 & 0b1111111) ^ K_l
+    return l, r
 
-    l_3, r_3 = r_2, S9[l_2] ^ r_2
-    l_3 = S7[r_2] ^ (r_3 & 0b1111111)
 
-    return Bytes(int.to_bytes(l_3 << 9 | r_3, 2, 'big'))
+def round_func(R_i, K_i):
+    K_int = _to_ints(K_i[:8]) + [K_i[-1]]
+    return Bytes(int.to_bytes(_round_func(int.from_bytes(R_i, 'big'), K_int), 4, 'big'))
 
 
-def fun_fo(KO_i, KI_i, x):
-    l, r = x.chunk(2)
+def fun_fl(KL_i, x):
+    return Bytes(int.to_bytes(_fl(_to_ints(KL_i), int.from_bytes(x, 'big')), 4, 'big'))
 
-    # Some sort of deranged Feistel network...
-    for i in range(3):
-        l, r = r, fun_fi(KI_i[i], l ^ KO_i[i]) ^ r
 
-    return l + r
+def fun_fi(K_i, x):
+    return Bytes(int.to_bytes(_fi(int.from_bytes(x, 'big'), int.from_bytes(K_i, 'big')), 2, 'big'))
+
+
+def fun_fo(KO_i, KI_i, x):
+    return Bytes(int.to_bytes(_fo(_to_ints(KO_i), _to_ints(KI_i), int.from_bytes(x, 'big')), 4, 'big'))
 
 
 # I WANT TO GET OFF MR. BONES' WILD RIDE
@@ -150,12 +186,16 @@ class KASUMI(FeistelNetwork, BlockCipher):
         self.key_schedule = key_schedule
         self.round_func = round_func
 
+        # Expanded once, as ints, for the block functions
+        self.round_keys = _int_round_keys(key_schedule(self.key))
+
 
 
     def __reprdir__(self):
         return ['key']
 
-    # For some reason KASUMI reverses the L_0 and R_0, so we need to feed it correctly into the FeistelNetwork
+    # The block functions run the eight rounds directly on 32-bit halves. `yield_encrypt` and
+    # `yield_decrypt` still go through the FeistelNetwork, which sees the halves swapped.
     def encrypt(self, plaintext: bytes) -> Bytes:
         """
         Encrypts `plaintext`.
@@ -166,11 +206,9 @@ class KASUMI(FeistelNetwork, BlockCipher):
         Returns:
             Bytes: Resulting ciphertext.
         """
-        plaintext = Bytes.wrap(plaintext)
-        half = len(plaintext) // 2
-        L_i, R_i = plaintext[:half], plaintext[half:]
-
-        return FeistelNetwork.encrypt(self, self.key, R_i + L_i)
+        x    = int.from_bytes(plaintext, 'big')
+        l, r = _encrypt_block(x >> 32, x & 0xFFFFFFFF, self.round_keys)
+        return Bytes(int.to_bytes(l << 32 | r, 8, 'big'))
 
 
     def decrypt(self, ciphertext: bytes) -> Bytes:
@@ -183,9 +221,6 @@ class KASUMI(FeistelNetwork, BlockCipher):
         Returns:
             Bytes: Resulting plaintext.
         """
-        plaintext = FeistelNetwork.decrypt(self, self.key, Bytes.wrap(ciphertext))
-
-        half = len(plaintext) // 2
-        plaintext = Bytes.wrap(plaintext)
-        L_i, R_i = plaintext[:half], plaintext[half:]
-        return R_i + L_i
+        x    = int.from_bytes(ciphertext, 'big')
+        l, r = _decrypt_block(x >> 32, x & 0xFFFFFFFF, self.round_keys)
+        return Bytes(int.to_bytes(l << 32 | r, 8, 'big'))
@@ -1,10 +1,12 @@
 from samson.block_ciphers.modes.ctr import CTR
 from samson.utilities.bytes import Bytes
+from samson.utilities.manipulation import reverse_bits
 from samson.core.primitives import EncryptionAlg, StreamingBlockCipherMode, Primitive, AuthenticatedCipher
 from samson.core.metadata import EphemeralType, EphemeralSpec, SizeType, SizeSpec, FrequencyType
 from samson.ace.decorators import register_primitive
 from samson.auxiliary.lazy_loader import LazyLoader
 from functools import lru_cache
+from itertools import zip_longest
 from typing import List
 
 _gf2 = LazyLoader('_gf2', globals(), 'samson.math.algebra.fields.gf2')
@@ -16,23 +18,59 @@ def _get_FF128():
 
 
 def int_to_elem(a):
-    return _get_FF128()(int(''.join(bin(a)[2:].zfill(128)[::-1]), 2))
+    return _get_FF128()(reverse_bits(a, 128))
 
 def elem_to_int(a):
-    return int(bin(int(a))[2:].zfill(128)[::-1], 2)
+    return reverse_bits(int(a), 128)
 
 
 
+def _gcm_shift(x: int) -> int:
+    # `-(x & 1)` is all ones when the bit shifted out is set, so no branch is needed
+    return (x >> 1) ^ (-(x & 1) & (0xe1 << (128 - 8)))
+
+
+def _shift_byte(x: int) -> int:
+    for _ in range(8):
+        x = _gcm_shift(x)
+
+    return x
+
+
+# What the eight bits shifted out of a product fold back into
 # Reference
 # https://github.com/tomato42/tlslite-ng/blob/master/tlslite/utils/aesgcm.py
-GCM_REDUCTION_TABLE = [
-    0x0000, 0x1c20, 0x3840, 0x2460, 0x7080, 0x6ca0, 0x48c0, 0x54e0,
-    0xe100, 0xfd20, 0xd940, 0xc560, 0x9180, 0x8da0, 0xa9c0, 0xb5e0,
-]
+GCM_REDUCTION_TABLE_8 = [_shift_byte(i) for i in range(256)]
+
+
+@lru_cache(256)
+def _build_product_table(H: int) -> tuple:
+    """
+    Multiples of `H` indexed by a byte of the other operand. Bit `7-k` of the index
+    stands for H*x^k, so `GCM.mul` can consume its input a byte at a time. Cached so
+    instances sharing a key (e.g. one per record) share the table.
+    """
+    table = [0] * 256
+    for k in range(8):
+        table[0x80 >> k] = H
+        H = _gcm_shift(H)
+
+    for i in range(3, 256):
+        if i & (i - 1):
+            table[i] = table[i & -i] ^ table[i & (i - 1)]
+
+    return tuple(table)
 
 
-def reverse_bits(int32: int) -> int:
-    return int(bin(int32)[2:].zfill(4)[::-1], 2)
+@lru_cache(1024)
+def _derive_hash_key_and_mask(key: bytes, nonce: bytes) -> tuple:
+    """
+    AES-GCM's `H = E_k(0)` and tag mask `P = E_k(N || 1)` as ints. Cached so repeated
+    multi-collision searches over the same keys don't re-run Rijndael.
+    """
+    from samson.block_ciphers.rijndael import Rijndael
+    rij = Rijndael(key)
+    return rij.encrypt(bytes(16)).int(), rij.encrypt(nonce + b'\x00\x00\x00\x01').int()
 
 
 @register_primitive()
@@ -56,13 +94,7 @@ class GCM(StreamingBlockCipherMode, AuthenticatedCipher):
         self.ctr        = CTR(self.cipher, b'\x00' * 8)
         self.tag_length = tag_length
 
-        # Precompute the product table
-        self.product_table = [0] * 16
-        self.product_table[reverse_bits(1)] = self.H
-
-        for i in range(2, 16, 2):
-            self.product_table[reverse_bits(i)]     = self.gcm_shift(self.product_table[reverse_bits(i // 2)])
-            self.product_table[reverse_bits(i + 1)] = self.product_table[reverse_bits(i)] ^ self.H
+        self.product_table = _build_product_table(self.H)
 
 
     def __reprdir__(self):
@@ -131,24 +163,31 @@ class GCM(StreamingBlockCipherMode, AuthenticatedCipher):
 
 
     def gcm_shift(self, x: int) -> int:
-        high_bit_set = x & 1
-        x >>= 1
-
-        if high_bit_set:
-            x ^= 0xe1 << (128 - 8)
-
-        return x
+        return _gcm_shift(x)
 
 
     def mul(self, y):
-        ret = 0
-
-        for _ in range(0, 128, 4):
-            high_bit = ret & 0xF
-            ret >>= 4
-            ret  ^= GCM_REDUCTION_TABLE[high_bit] << (128 - 16)
-            ret  ^= self.product_table[y & 0xF]
-            y   >>= 4
+        # Unrolled over the 16 bytes of `y`. The first step starts from zero, so it
+        # has nothing to reduce.
+        table = self.product_table
+        red   = GCM_REDUCTION_TABLE_8
+
+        ret = table[y & 0xFF]
+        ret = (ret >> 8) ^ red[ret & 0xFF] ^ table[(y >>   8) & 0xFF]
+        ret = (ret >> 8) ^ red[ret & 0xFF] ^ table[(y >>  16) & 0xFF]
+        ret = (ret >> 8) ^ red[ret & 0xFF] ^ table[(y >>  24) & 0xFF]
+        ret = (ret >> 8) ^ red[ret & 0xFF] ^ table[(y >>  32) & 0xFF]
+        ret = (ret >> 8) ^ red[ret & 0xFF] ^ table[(y >>  40) & 0xFF]
+        ret = (ret >> 8) ^ red[ret & 0xFF] ^ table[(y >>  48) & 0xFF]
+        ret = (ret >> 8) ^ red[ret & 0xFF] ^ table[(y >>  56) & 0xFF]
+        ret = (ret >> 8) ^ red[ret & 0xFF] ^ table[(y >>  64) & 0xFF]
+        ret = (ret >> 8) ^ red[ret & 0xFF] ^ table[(y >>  72) & 0xFF]
+        ret = (ret >> 8) ^ red[ret & 0xFF] ^ table[(y >>  80) & 0xFF]
+        ret = (ret >> 8) ^ red[ret & 0xFF] ^ table[(y >>  88) & 0xFF]
+        ret = (ret >> 8) ^ red[ret & 0xFF] ^ table[(y >>  96) & 0xFF]
+        ret = (ret >> 8) ^ red[ret & 0xFF] ^ table[(y >> 104) & 0xFF]
+        ret = (ret >> 8) ^ red[ret & 0xFF] ^ table[(y >> 112) & 0xFF]
+        ret = (ret >> 8) ^ red[ret & 0xFF] ^ table[(y >> 120) & 0xFF]
 
         return ret
 
@@ -165,11 +204,13 @@ class GCM(StreamingBlockCipherMode, AuthenticatedCipher):
 
 
     def update(self, y: int, data: Bytes) -> int:
-        for chunk in data.chunk(16):
-            y ^= chunk.int()
-            y  = self.mul(y)
-
+        # Decode blocks straight out of a view instead of building `Bytes` chunks
+        view  = memoryview(data)
         extra = len(data) % 16
+        mul   = self.mul
+
+        for i in range(0, len(data) - extra, 16):
+            y = mul(y ^ int.from_bytes(view[i:i+16], 'big'))
 
         if extra != 0:
             block = bytearray(16)
@@ -200,21 +241,25 @@ class GCM(StreamingBlockCipherMode, AuthenticatedCipher):
         from samson.math.polynomial import Polynomial
         from samson.block_ciphers.rijndael import Rijndael
 
-        def gcm_to_poly(ad, ciphertext, tag):
+        def gcm_to_coeffs(ad, ciphertext, tag):
             l = (len(ad) << (3 + 64)) | (len(ciphertext) << 3)
 
             ct_ints = [chunk.int() for chunk in ciphertext.pad_congruent_right(16).chunk(16)[::-1]]
             ad_ints = [chunk.int() for chunk in ad.pad_congruent_right(16).chunk(16)[::-1]]
 
-            return Polynomial([int_to_elem(coeff) for coeff in [tag.int(), l, *ct_ints, *ad_ints]])
+            return [tag.int(), l, *ct_ints, *ad_ints]
 
 
         auth_data_a, ciphertext_a, tag_a, auth_data_b, ciphertext_b, tag_b = [Bytes.wrap(item) for item in [auth_data_a, ciphertext_a, tag_a, auth_data_b, ciphertext_b, tag_b]]
-        poly_a = gcm_to_poly(auth_data_a, ciphertext_a, tag_a)
-        poly_b = gcm_to_poly(auth_data_b, ciphertext_b, tag_b)
+        coeffs_a = gcm_to_coeffs(auth_data_a, ciphertext_a, tag_a)
+        coeffs_b = gcm_to_coeffs(auth_data_b, ciphertext_b, tag_b)
+
+        # Addition in GF(2^128) is XOR, and bit reflection is linear, so the difference
+        # can be taken on the raw blocks before building a single polynomial
+        diff = [a ^ b for a, b in zip_longest(coeffs_a, coeffs_b, fillvalue=0)]
 
         # 3 is the smallest factor of (2**128) - 1
-        roots      = (poly_a + poly_b).roots(subgroup_divisor=3)
+        roots      = Polynomial([int_to_elem(coeff) for coeff in diff]).roots(subgroup_divisor=3)
         candidates = [elem_to_int(r) for r in roots]
         rij        = Rijndael(Bytes.random(16))
 
@@ -265,7 +310,6 @@ class GCM(StreamingBlockCipherMode, AuthenticatedCipher):
         References:
             https://www.usenix.org/system/files/sec21summer_len.pdf
         """
-        from samson.block_ciphers.rijndael import Rijndael
         Q = _get_FF128()[_sym.Symbol('x')]
 
         K = [Bytes.wrap(k) for k in keys]
@@ -277,9 +321,7 @@ class GCM(StreamingBlockCipherMode, AuthenticatedCipher):
         pairs = []
 
         for k in K:
-            rij = Rijndael(k)
-            H   = rij.encrypt(Bytes().zfill(16)).int()
-            P   = rij.encrypt(N + Bytes(0x01).zfill(4)).int()
+            H, P = _derive_hash_key_and_mask(bytes(k), bytes(N))
 
             H   = int_to_elem(H)
             y   = ((L*H) + int_to_elem(P) + Ti) * H**-2
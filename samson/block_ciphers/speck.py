@@ -111,23 +111,39 @@ class Speck(BlockCipher):
 
 
     def encrypt(self, plaintext: bytes) -> bytes:
-        plaintext = self._ensure_endianness(plaintext).zfill(self.bs_bits // 8)
-        y,x = [chunk.int() for chunk in plaintext.chunk(self.bs_bits // 16)]
+        half      = self.bs_bits // 16
+        plaintext = self._ensure_endianness(plaintext).zfill(half*2)
+        y,x = [chunk.int() for chunk in plaintext.chunk(half)]
 
-        for k in self.round_keys:
-            x,y = self.forward_round(x, y, k)
+        # `forward_round` inlined with the rotation constants bound to locals
+        bits, mask  = half*8, self.mask
+        alpha, beta = self.alpha, self.beta
+        ralpha      = bits - alpha
+        rbeta       = bits - beta
 
+        for k in self.round_keys:
+            x = ((((x >> alpha) | (x << ralpha)) & mask) + y) & mask ^ k
+            y = (((y << beta) | (y >> rbeta)) & mask) ^ x
 
-        return Bytes(y, 'little').zfill(self.bs_bits // 16) + Bytes(x, 'little').zfill(self.bs_bits // 16)
+        return Bytes(int.to_bytes(x << bits | y, half*2, 'little'), 'little')
 
 
 
     def decrypt(self, ciphertext: bytes) -> bytes:
-        ciphertext = self._ensure_endianness(ciphertext).zfill(self.bs_bits // 8)
-        y,x = [chunk.int() for chunk in ciphertext.chunk(self.bs_bits // 16)]
-
-        for k in self.round_keys[::-1]:
-            x,y = self.backwards_round(x, y, k)
-
-
-        return Bytes(y, 'little').zfill(self.bs_bits // 16) + Bytes(x, 'little').zfill(self.bs_bits // 16)
+        half       = self.bs_bits // 16
+        ciphertext = self._ensure_endianness(ciphertext).zfill(half*2)
+        y,x = [chunk.int() for chunk in ciphertext.chunk(half)]
+
+        # `backwards_round` inlined with the rotation constants bound to locals
+        bits, mask  = half*8, self.mask
+        alpha, beta = self.alpha, self.beta
+        ralpha      = bits - alpha
+        rbeta       = bits - beta
+
+        for k in reversed(self.round_keys):
+            y ^= x
+            y  = ((y >> beta) | (y << rbeta)) & mask
+            x  = ((x ^ k) - y) & mask
+            x  = ((x << alpha) | (x >> ralpha)) & mask
+
+        return Bytes(int.to_bytes(x << bits | y, half*2, 'little'), 'little')
@@ -6,6 +6,9 @@ from samson.ace.decorators import register_primitive
 DELTA  = 0x9E3779B9
 MASK32 = 2**32-1
 
+# Only the low 32 bits of the running sum reach the masked state
+ROUND_SUMS = tuple((DELTA * i) & MASK32 for i in range(1, 33))
+
 
 @register_primitive()
 class TEA(BlockCipher):
@@ -21,35 +24,28 @@ class TEA(BlockCipher):
 
     def __init__(self, key: bytes):
         Primitive.__init__(self)
-        self.key = Bytes.wrap(key).zfill(16)
+        self.key       = Bytes.wrap(key).zfill(16)
+        self.key_words = [r.int() for r in self.key.chunk(4)]
 
 
     def encrypt(self, plaintext: bytes) -> bytes:
-        k0, k1, k2, k3 = [r.int() for r in self.key.chunk(4)]
+        k0, k1, k2, k3 = self.key_words
         v0, v1         = [r.int() for r in Bytes.wrap(plaintext).chunk(4)]
 
-        d_sum = 0
-        for _ in range(32):
-            d_sum += DELTA
-            v0    += ((v1<<4) + k0) ^ (v1 + d_sum) ^ ((v1>>5) + k1)
-            v0    &= MASK32
-            v1    += ((v0<<4) + k2) ^ (v0 + d_sum) ^ ((v0>>5) + k3)
-            v1    &= MASK32
-        
-        return Bytes(v0).zfill(4) + Bytes(v1).zfill(4)
+        for d_sum in ROUND_SUMS:
+            v0 = (v0 + (((v1<<4) + k0) ^ (v1 + d_sum) ^ ((v1>>5) + k1))) & MASK32
+            v1 = (v1 + (((v0<<4) + k2) ^ (v0 + d_sum) ^ ((v0>>5) + k3))) & MASK32
+
+        return Bytes(int.to_bytes(v0 << 32 | v1, 8, 'big'))
 
 
 
     def decrypt(self, ciphertext: bytes) -> bytes:
-        k0, k1, k2, k3 = [r.int() for r in self.key.chunk(4)]
+        k0, k1, k2, k3 = self.key_words
         v0, v1         = [r.int() for r in Bytes.wrap(ciphertext).chunk(4)]
 
-        d_sum = 0xC6EF3720
-        for _ in range(32):
-            v1    -= ((v0<<4) + k2) ^ (v0 + d_sum) ^ ((v0>>5) + k3)
-            v1    &= MASK32
-            v0    -= ((v1<<4) + k0) ^ (v1 + d_sum) ^ ((v1>>5) + k1)
-            v0    &= MASK32
-            d_sum -= DELTA
+        for d_sum in reversed(ROUND_SUMS):
+            v1 = (v1 - (((v0<<4) + k2) ^ (v0 + d_sum) ^ ((v0>>5) + k3))) & MASK32
+            v0 = (v0 - (((v1<<4) + k0) ^ (v1 + d_sum) ^ ((v1>>5) + k1))) & MASK32
 
-        return Bytes(v0).zfill(4) + Bytes(v1).zfill(4)
+        return Bytes(int.to_bytes(v0 << 32 | v1, 8, 'big'))
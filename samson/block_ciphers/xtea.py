@@ -23,34 +23,39 @@ class XTEA(BlockCipher):
         Primitive.__init__(self)
         self.key    = Bytes.wrap(key).zfill(16)
         self.rounds = rounds
+        self.key_schedule()
+
+
+    def key_schedule(self):
+        """
+        Precomputes `sum + key[...]` for both halves of every round. Only the low
+        32 bits of these reach the masked state.
+        """
+        k = [r.int() for r in self.key.chunk(4)]
+        self.round_keys = []
+
+        for i in range(self.rounds):
+            d_sum = DELTA*i
+            n_sum = d_sum + DELTA
+            self.round_keys.append(((d_sum + k[d_sum & 3]) & MASK32, (n_sum + k[(n_sum>>11) & 3]) & MASK32))
 
 
     def encrypt(self, plaintext: bytes) -> bytes:
-        k      = [r.int() for r in self.key.chunk(4)]
         v0, v1 = [r.int() for r in Bytes.wrap(plaintext).chunk(4)]
 
-        d_sum = 0
-        for _ in range(self.rounds):
-            v0 += (((v1 << 4) ^ (v1 >> 5)) + v1) ^ (d_sum + k[d_sum & 3])
-            v0    &= MASK32
-            d_sum += DELTA
-            v1 += (((v0 << 4) ^ (v0 >> 5)) + v0) ^ (d_sum + k[(d_sum>>11) & 3])
-            v1    &= MASK32
-        
-        return Bytes(v0).zfill(4) + Bytes(v1).zfill(4)
+        for k0, k1 in self.round_keys:
+            v0 = (v0 + ((((v1 << 4) ^ (v1 >> 5)) + v1) ^ k0)) & MASK32
+            v1 = (v1 + ((((v0 << 4) ^ (v0 >> 5)) + v0) ^ k1)) & MASK32
+
+        return Bytes(int.to_bytes(v0 << 32 | v1, 8, 'big'))
 
 
 
     def decrypt(self, ciphertext: bytes) -> bytes:
-        k      = [r.int() for r in self.key.chunk(4)]
         v0, v1 = [r.int() for r in Bytes.wrap(ciphertext).chunk(4)]
 
-        d_sum = DELTA*self.rounds
-        for _ in range(self.rounds):
-            v1 -= (((v0 << 4) ^ (v0 >> 5)) + v0) ^ (d_sum + k[(d_sum>>11) & 3])
-            v1    &= MASK32
-            d_sum -= DELTA
-            v0 -= (((v1 << 4) ^ (v1 >> 5)) + v1) ^ (d_sum + k[d_sum & 3])
-            v0    &= MASK32
+        for k0, k1 in reversed(self.round_keys):
+            v1 = (v1 - ((((v0 << 4) ^ (v0 >> 5)) + v0) ^ k1)) & MASK32
+            v0 = (v0 - ((((v1 << 4) ^ (v1 >> 5)) + v1) ^ k0)) & MASK32
 
-        return Bytes(v0).zfill(4) + Bytes(v1).zfill(4)
+        return Bytes(int.to_bytes(v0 << 32 | v1, 8, 'big'))
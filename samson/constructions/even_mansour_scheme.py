@@ -1,4 +1,5 @@
 from samson.utilities.bytes import Bytes
+from samson.utilities.manipulation import xor_int_buff
 from samson.core.base_object import BaseObject
 from types import FunctionType
 
@@ -21,6 +22,17 @@ class EvenMansourScheme(BaseObject):
         self.K2 = Bytes.wrap(K2 or K1)
         self.block_size = len(self.K1)
 
+        # Whitening is a single bigint XOR against these
+        self._k1_int = self.K1.int()
+        self._k2_int = self.K2.int()
+
+
+    def __reprdir__(self):
+        return ['F0', 'F1', 'K1', 'K2', 'block_size']
+
+
+    def _whiten(self, key: Bytes, key_int: int, data: bytes) -> Bytes:
+        return Bytes(xor_int_buff(key_int, data, len(key), key.byteorder), key.byteorder)
 
 
     def encrypt(self, plaintext: bytes) -> Bytes:
@@ -33,9 +45,9 @@ class EvenMansourScheme(BaseObject):
         Returns:
             Bytes: Resulting ciphertext.
         """
-        k1_p = self.K1 ^ plaintext
+        k1_p = self._whiten(self.K1, self._k1_int, plaintext)
         f_p  = self.F0(k1_p)
-        return f_p ^ self.K2
+        return self._whiten(self.K2, self._k2_int, f_p)
 
 
 
@@ -49,6 +61,6 @@ class EvenMansourScheme(BaseObject):
         Returns:
             Bytes: Resulting plaintext.
         """
-        k2_p = self.K2 ^ ciphertext
+        k2_p = self._whiten(self.K2, self._k2_int, ciphertext)
         f_p  = self.F1(k2_p)
-        return f_p ^ self.K1
+        return self._whiten(self.K1, self._k1_int, f_p)
@@ -12,7 +12,13 @@ class FiatShamirProofStream(BaseObject):
         self.hash_func = hash_func or SHAKE256(256).hash
         self.objects   = []
         self.read_idx  = 0
-    
+        self._encoded  = []
+        self._digests  = []
+
+
+    def __reprdir__(self):
+        return ['hash_func', 'objects', 'read_idx']
+
 
     def read(self) -> object:
         if len(self.objects) < self.read_idx+1:
@@ -24,11 +30,22 @@ class FiatShamirProofStream(BaseObject):
 
     def write(self, obj):
         self.objects.append(obj)
+
+        self._encoded.append(dill.dumps(obj))
     
 
     def hash(self, up_to_read: bool=False):
-        idx = None
+        idx = len(self._encoded)
         if up_to_read:
             idx = self.read_idx
 
-        return self.hash_func(dill.dumps(self.objects[:idx]))
+        if not idx:
+            return self.hash_func(b'')
+
+        # Each object is chained onto the previous digest, so every object is absorbed
+        # once over the life of the stream instead of on every call
+        while len(self._digests) < idx:
+            prev = self._digests[-1] if self._digests else b''
+            self._digests.append(self.hash_func(bytes(prev) + self._encoded[len(self._digests)]))
+
+        return self._digests[idx-1]
@@ -1,8 +1,11 @@
 from samson.core.base_object import BaseObject
-from samson.hashes.sha3 import SHAKE256
+from samson.utilities.bytes import Bytes
+import hashlib
 
-def split(leafs):
-    return leafs[:len(leafs) // 2], leafs[len(leafs) // 2:]
+
+def _shake256(data: bytes) -> Bytes:
+    # Same output as `SHAKE256(256).hash` without the pure-Python sponge
+    return Bytes(hashlib.shake_256(bytes(data)).digest(32))
 
 
 class MerkleTree(BaseObject):
@@ -12,32 +15,56 @@ class MerkleTree(BaseObject):
     """
 
     def __init__(self, hash_func: 'function'=None, leafs: list=None) -> None:
-        self.hash_func = hash_func or SHAKE256(256).hash
+        self.hash_func = hash_func or _shake256
         self.leafs     = leafs
 
         if leafs and len(leafs) & (len(leafs)-1):
             raise ValueError("'leafs' length must be a power of 2")
 
 
-    def __commit(self, leafs):
-        if len(leafs) == 1:
-            return leafs[0]
-        else:
-            left, right = split(leafs)
-            return self.hash_func(self.__commit(left) + self.__commit(right))
-    
-
-    def __open(self, idx, leafs):
-        if len(leafs) == 2:
-            return [leafs[1-idx]]
-
-        elif idx < len(leafs) // 2:
-            left, right = split(leafs)
-            return self.__open(idx, left) + [self.__commit(right)]
-        
-        else:
-            left, right = split(leafs)
-            return self.__open(idx - len(leafs) // 2, right) + [self.__commit(left)]
+    def __reprdir__(self):
+        return ['hash_func', 'leafs']
+
+
+    @property
+    def leafs(self) -> list:
+        return self._leafs
+
+
+    @leafs.setter
+    def leafs(self, leafs: list):
+        # New leaves mean a new tree
+        self._leafs = leafs
+        self._nodes = None
+
+
+    @property
+    def nodes(self) -> list:
+        """
+        Every level of the tree from the leaf hashes up to the root. Built once
+        so `open` can read siblings instead of rehashing whole subtrees.
+        """
+        if self._nodes is None:
+            hash_func = self.hash_func
+            level     = [hash_func(bytes(l)) for l in self.leafs]
+            nodes     = [level]
+
+            while len(level) > 1:
+                level = [hash_func(level[i] + level[i+1]) for i in range(0, len(level), 2)]
+                nodes.append(level)
+
+            self._nodes = nodes
+
+        return self._nodes
+
+
+    def __open(self, idx):
+        path = []
+        for level in self.nodes[:-1]:
+            path.append(level[idx ^ 1])
+            idx >>= 1
+
+        return path
 
 
     def __verify(self, root: bytes, idx: int, path: list, leaf: bytes):
@@ -54,15 +81,15 @@ class MerkleTree(BaseObject):
 
     @property
     def l1_hashes(self):
-        return [self.hash_func(bytes(l)) for l in self.leafs]
+        return list(self.nodes[0])
 
 
     def commit(self):
-        return self.__commit(self.l1_hashes)
+        return self.nodes[-1][0]
 
 
     def open(self, idx):
-        return self.__open(idx, self.l1_hashes)
+        return self.__open(idx)
 
 
     def verify(self, root: bytes, idx: int, path: list, leaf: object):
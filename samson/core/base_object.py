@@ -126,6 +126,9 @@ def item_formatter(val, use_color):
 
 
 class BaseObject(object):
+    # Lets subclasses opt into `__slots__`; subclasses that don't still get a `__dict__`
+    __slots__ = ()
+
     def __reprdir__(self):
         return self.__dict__.keys()
     
@@ -5,6 +5,13 @@ from pyasn1.type.univ import Sequence
 # These items MUST be in this order to be accepted by the KeyStore
 class AsymmetricAuthorizationList(AuthorizationList):
     KEY_FORMAT = KMKeyFormat.KM_KEY_FORMAT_PKCS8
+    PARSE_SLOTS = {
+        AlgorithmAuthorization: 0,
+        PurposeAuthorization: 1,
+        KeySizeAuthorization: 2,
+        DigestAuthorization: 3,
+        PaddingAuthorization: 4
+    }
 
     def __init__(self, algorithm: AlgorithmAuthorization, purposes: PurposeAuthorization=None, key_size: KeySizeAuthorization=None, digests: DigestAuthorization=None, paddings: PaddingAuthorization=None) -> None:
         self.algorithm = Authorization.check_or_instantiate(algorithm) if algorithm else None
@@ -16,29 +23,23 @@ class AsymmetricAuthorizationList(AuthorizationList):
 
     @staticmethod
     def parse(sequence: Sequence) -> 'AsymmetricAuthorizationList':
-
-        type_dict = {}
+        # Positional in `__init__` order; authorizations without a slot are dropped
+        slots = [None]*5
         for idx in sequence:
             authorization = Authorization.parse(sequence[idx])
-            type_dict[authorization.__class__] = authorization
-        
-        return AsymmetricAuthorizationList(
-            algorithm=type_dict.get(AlgorithmAuthorization),
-            purposes=type_dict.get(PurposeAuthorization),
-            key_size=type_dict.get(KeySizeAuthorization),
-            digests=type_dict.get(DigestAuthorization),
-            paddings=type_dict.get(PaddingAuthorization)
-        )
+            slot = AsymmetricAuthorizationList.PARSE_SLOTS.get(authorization.__class__)
+
+            if slot is not None:
+                slots[slot] = authorization
+
+        return AsymmetricAuthorizationList(*slots)
         
     
 
     def build(self):
         auth_list = Sequence()
 
-        i = 0
-        for obj in (self.purposes, self.algorithm, self.key_size, self.digests, self.paddings):
-            if obj:
-                auth_list[i] = obj.build()
-                i += 1
+        for i, obj in enumerate(filter(None, (self.purposes, self.algorithm, self.key_size, self.digests, self.paddings))):
+            auth_list[i] = obj.build()
 
         return auth_list
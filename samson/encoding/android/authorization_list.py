@@ -18,28 +18,23 @@ class AuthorizationList(BaseObject):
 
     @staticmethod
     def parse(sequence: Sequence) -> 'SymmetricAuthorizationList':
-        type_dict = {}
+        # Positional in `__init__` order; authorizations without a slot are dropped
+        slots = [None]*5
         for idx in sequence:
             authorization = Authorization.parse(sequence[idx])
-            type_dict[authorization.__class__] = authorization
-        
-        return SymmetricAuthorizationList(
-            algorithm=type_dict.get(AlgorithmAuthorization),
-            purposes=type_dict.get(PurposeAuthorization),
-            key_size=type_dict.get(KeySizeAuthorization),
-            block_modes=type_dict.get(BlockModeAuthorization),
-            paddings=type_dict.get(PaddingAuthorization)
-        )
+            slot = SymmetricAuthorizationList.PARSE_SLOTS.get(authorization.__class__)
+
+            if slot is not None:
+                slots[slot] = authorization
+
+        return SymmetricAuthorizationList(*slots)
 
 
     def build(self):
         auth_list = Sequence()
 
-        i = 0
-        for obj in (self.purposes, self.algorithm, self.key_size, self.block_modes, self.paddings):
-            if obj:
-                auth_list[i] = obj.build()
-                i += 1
+        for i, obj in enumerate(filter(None, (self.purposes, self.algorithm, self.key_size, self.block_modes, self.paddings))):
+            auth_list[i] = obj.build()
 
         return auth_list
 
@@ -48,6 +43,13 @@ class AuthorizationList(BaseObject):
 # These items MUST be in this order to be accepted by the KeyStore
 class SymmetricAuthorizationList(AuthorizationList):
     KEY_FORMAT = KMKeyFormat.KM_KEY_FORMAT_RAW
+    PARSE_SLOTS = {
+        AlgorithmAuthorization: 0,
+        PurposeAuthorization: 1,
+        KeySizeAuthorization: 2,
+        BlockModeAuthorization: 3,
+        PaddingAuthorization: 4
+    }
 
     def __init__(self, algorithm: AlgorithmAuthorization, purposes: PurposeAuthorization=None, key_size: KeySizeAuthorization=None, block_modes: BlockModeAuthorization=None, paddings: PaddingAuthorization=None) -> None:
         self.algorithm   = Authorization.check_or_instantiate(algorithm)
@@ -59,29 +61,24 @@ class SymmetricAuthorizationList(AuthorizationList):
 
     @staticmethod
     def parse(sequence: Sequence) -> 'SymmetricAuthorizationList':
-        type_dict = {}
+        # Positional in `__init__` order; authorizations without a slot are dropped
+        slots = [None]*5
         for idx in sequence:
             authorization = Authorization.parse(sequence[idx])
-            type_dict[authorization.__class__] = authorization
-        
-        return SymmetricAuthorizationList(
-            algorithm=type_dict.get(AlgorithmAuthorization),
-            purposes=type_dict.get(PurposeAuthorization),
-            key_size=type_dict.get(KeySizeAuthorization),
-            block_modes=type_dict.get(BlockModeAuthorization),
-            paddings=type_dict.get(PaddingAuthorization)
-        )
+            slot = SymmetricAuthorizationList.PARSE_SLOTS.get(authorization.__class__)
+
+            if slot is not None:
+                slots[slot] = authorization
+
+        return SymmetricAuthorizationList(*slots)
         
     
 
     def build(self):
         auth_list = Sequence()
 
-        i = 0
-        for obj in (self.purposes, self.algorithm, self.key_size, self.block_modes, self.paddings):
-            if obj:
-                auth_list[i] = obj.build()
-                i += 1
+        for i, obj in enumerate(filter(None, (self.purposes, self.algorithm, self.key_size, self.block_modes, self.paddings))):
+            auth_list[i] = obj.build()
 
         return auth_list
 
@@ -89,6 +86,13 @@ class SymmetricAuthorizationList(AuthorizationList):
 # These items MUST be in this order to be accepted by the KeyStore
 class AsymmetricAuthorizationList(AuthorizationList):
     KEY_FORMAT = KMKeyFormat.KM_KEY_FORMAT_PKCS8
+    PARSE_SLOTS = {
+        AlgorithmAuthorization: 0,
+        PurposeAuthorization: 1,
+        KeySizeAuthorization: 2,
+        DigestAuthorization: 3,
+        PaddingAuthorization: 4
+    }
 
     def __init__(self, algorithm: AlgorithmAuthorization, purposes: PurposeAuthorization=None, key_size: KeySizeAuthorization=None, digests: DigestAuthorization=None, paddings: PaddingAuthorization=None) -> None:
         self.algorithm = Authorization.check_or_instantiate(algorithm) if algorithm else None
@@ -100,29 +104,23 @@ class AsymmetricAuthorizationList(AuthorizationList):
 
     @staticmethod
     def parse(sequence: Sequence) -> 'AsymmetricAuthorizationList':
-
-        type_dict = {}
+        # Positional in `__init__` order; authorizations without a slot are dropped
+        slots = [None]*5
         for idx in sequence:
             authorization = Authorization.parse(sequence[idx])
-            type_dict[authorization.__class__] = authorization
-        
-        return AsymmetricAuthorizationList(
-            algorithm=type_dict.get(AlgorithmAuthorization),
-            purposes=type_dict.get(PurposeAuthorization),
-            key_size=type_dict.get(KeySizeAuthorization),
-            digests=type_dict.get(DigestAuthorization),
-            paddings=type_dict.get(PaddingAuthorization)
-        )
+            slot = AsymmetricAuthorizationList.PARSE_SLOTS.get(authorization.__class__)
+
+            if slot is not None:
+                slots[slot] = authorization
+
+        return AsymmetricAuthorizationList(*slots)
         
     
 
     def build(self):
         auth_list = Sequence()
 
-        i = 0
-        for obj in (self.purposes, self.algorithm, self.key_size, self.digests, self.paddings):
-            if obj:
-                auth_list[i] = obj.build()
-                i += 1
+        for i, obj in enumerate(filter(None, (self.purposes, self.algorithm, self.key_size, self.digests, self.paddings))):
+            auth_list[i] = obj.build()
 
         return auth_list
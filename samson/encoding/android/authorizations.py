@@ -6,14 +6,21 @@ from pyasn1.type import tag
 # https://android.googlesource.com/platform/cts/+/master/tests/security/src/android/keystore/cts/AuthorizationList.java
 class AuthorizationList(BaseObject):
     KEY_FORMAT = None
+    _BY_FORMAT = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        if cls.__dict__.get('KEY_FORMAT') is not None:
+            AuthorizationList._BY_FORMAT[cls.KEY_FORMAT] = cls
+
 
     @classmethod
     def parse(cls, key_format: KMKeyFormat, sequence):
-        for subclass in cls.__subclasses__():
-            if subclass.KEY_FORMAT == key_format:
-                return subclass.parse(sequence)
-        
-        raise ValueError(f'No registered subclass for {key_format}')
+        if key_format not in cls._BY_FORMAT:
+            raise ValueError(f'No registered subclass for {key_format}')
+
+        return cls._BY_FORMAT[key_format].parse(sequence)
 
 
     def build(self):
@@ -23,6 +30,23 @@ class AuthorizationList(BaseObject):
 class Authorization(BaseObject):
     TAG = None
 
+    # Registered by `__init_subclass__` so dispatch is a lookup rather than a subclass walk
+    _TAG_TO_CLS    = {}
+    _TAG_ID_TO_CLS = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Only classes that declare their own TAG; inheriting one shouldn't shadow the parent
+        if cls.__dict__.get('TAG') is not None:
+            tag_id = remove_tag_type(cls.TAG.value)
+            Authorization._TAG_TO_CLS[cls.TAG]   = cls
+            Authorization._TAG_ID_TO_CLS[tag_id] = cls
+
+            # Immutable, so every `build` can share it
+            cls._EXPLICIT_TAG = tag.Tag(tag.tagClassContext, tag.tagFormatConstructed, tag_id)
+
+
     @staticmethod
     def check_or_instantiate(authorization):
         if issubclass(authorization.__class__, Authorization):
@@ -33,30 +57,23 @@ class Authorization(BaseObject):
 
     @classmethod
     def instantiate(cls, tag, *args, **kwargs):
-        if cls.TAG == tag:
-            return cls(*args, **kwargs)
+        subclass = Authorization._TAG_TO_CLS.get(tag)
 
-        for subclass in cls.__subclasses__():
-            try:
-                return subclass.instantiate(tag, *args, **kwargs)
-            except ValueError:
-                pass
+        if subclass is None or not issubclass(subclass, cls):
+            raise ValueError(f'No registered subclass for tag {tag}')
 
-        raise ValueError(f'No registered subclass for tag {tag}')
+        return subclass(*args, **kwargs)
 
 
     @classmethod
     def parse(cls, item: object) -> 'Authorization':
-        if cls.TAG and remove_tag_type(cls.TAG.value) == item.tagSet.superTags[1].tagId:
-            return cls._parse(item)
-
-        for subclass in cls.__subclasses__():
-            try:
-                return subclass.parse(item)
-            except ValueError:
-                pass
-        
-        raise ValueError(f'No registered subclass for tagId {item.tagSet.superTags[1].tagId}')
+        tag_id   = item.tagSet.superTags[1].tagId
+        subclass = Authorization._TAG_ID_TO_CLS.get(tag_id)
+
+        if subclass is None or not issubclass(subclass, cls):
+            raise ValueError(f'No registered subclass for tagId {tag_id}')
+
+        return subclass._parse(item)
 
 
 
@@ -67,7 +84,7 @@ class NullAuthorization(Authorization):
 
 
     def build(self):
-        return Null().subtype(explicitTag=tag.Tag(tag.tagClassContext, tag.tagFormatConstructed, remove_tag_type(self.TAG.value)))
+        return Null().subtype(explicitTag=self._EXPLICIT_TAG)
 
 
 
@@ -100,7 +117,7 @@ class SetAuthorization(Authorization):
 
 
     def build(self):
-        set_obj = Set().subtype(explicitTag=tag.Tag(tag.tagClassContext, tag.tagFormatConstructed, remove_tag_type(self.TAG.value)))
+        set_obj = Set().subtype(explicitTag=self._EXPLICIT_TAG)
         
         for i, sub_obj in enumerate(self):
             set_obj[i] = Integer(sub_obj.value)
@@ -121,7 +138,7 @@ class IntegerAuthorization(Authorization):
 
 
     def build(self):
-        return Integer(int(self)).subtype(explicitTag=tag.Tag(tag.tagClassContext, tag.tagFormatConstructed, remove_tag_type(self.TAG.value)))
+        return Integer(int(self)).subtype(explicitTag=self._EXPLICIT_TAG)
 
 
 class OctectStringAuthorization(Authorization):
@@ -137,7 +154,7 @@ class OctectStringAuthorization(Authorization):
 
 
     def build(self):
-        return OctetString(str(self)).subtype(explicitTag=tag.Tag(tag.tagClassContext, tag.tagFormatConstructed, remove_tag_type(self.TAG.value)))
+        return OctetString(str(self)).subtype(explicitTag=self._EXPLICIT_TAG)
 
 
 class NamedConstantAuthorization(IntegerAuthorization):
@@ -11,10 +11,29 @@ def xor_buffs(buf1: bytes, buf2: bytes) -> bytearray:
     Returns:
         bytearray: Resulting bytes.
     """
-    if len(buf1) != len(buf2):
+    return xor_int_buff(int.from_bytes(buf1, 'big'), buf2, len(buf1))
+
+
+
+def xor_int_buff(val: int, buf: bytes, length: int, byteorder: str='big') -> bytearray:
+    """
+    XORs an integer into a byte buffer. Useful when one side (e.g. a key) is fixed
+    and can be converted to an int once.
+
+    Parameters:
+        val       (int): Integer form of the other `length`-byte buffer.
+        buf     (bytes): Byte buffer.
+        length    (int): Length `buf` must have.
+        byteorder (str): Byte order of both `val` and `buf`.
+
+    Returns:
+        bytearray: Resulting bytes.
+    """
+    if len(buf) != length:
         raise ValueError('Buffers must be equal length.')
 
-    return bytearray([x ^ y for x, y in zip(buf1, buf2)])
+    # One bigint XOR instead of a Python-level loop over the bytes
+    return bytearray(int.to_bytes(val ^ int.from_bytes(buf, byteorder), length, byteorder))
 
 
 
@@ -153,6 +172,8 @@ def unxorshift_right(x: int, n: int, bits: int) -> int:
     return y
 
 
+_BYTE_REVERSED = bytes(int(f'{i:08b}'[::-1], 2) for i in range(256))
+
 def reverse_bits(x: int, bits: int) -> int:
     """
     Reverses the bit ordering of an integer.
@@ -164,8 +185,7 @@ def reverse_bits(x: int, bits: int) -> int:
     Returns:
         int: Reversed bit-order integer.
     """
-    y = 0
-    for _ in range(bits):
-        y = (y << 1) | (x & 1)
-        x >>= 1
-    return y
+    # Reverse whole bytes through a table, then drop the padding bits
+    num_bytes = (bits + 7) // 8
+    x_bytes   = int.to_bytes(x & ((1 << bits) - 1), num_bytes, 'little')
+    return int.from_bytes(x_bytes.translate(_BYTE_REVERSED), 'big') >> (num_bytes*8 - bits)
@@ -58,3 +58,29 @@ class ConstraintSystemTestCase(unittest.TestCase):
     # TODO: Write solution
     def test_oneof_eq_conv(self):
         self.assertEqual(oo_diff + oo_diff_b, ConstraintSystem([a01, a10]))
+
+
+    def test_bv_process(self):
+        from samson.auxiliary.symbit import BitVector
+
+        def f(a: BitVector[2], b: BitVector[2]):
+            return a & b
+
+        bv = BitVector.from_func(f)
+        self.assertEqual(bv.solve(3).generate(), [{'a0': 1, 'a1': 1, 'b0': 1, 'b1': 1}])
+
+
+    def test_merge_oo(self):
+        from samson.auxiliary.constraint_system import _merge_oo
+        pairs = set(_merge_oo(oo_diff.con_sys, oo_diff.con_sys))
+        self.assertEqual(pairs, {(con_sys, con_sys) for con_sys in oo_diff.con_sys})
+
+
+    def test_oneof_coalesce(self):
+        oo = OneOfConstraint({'a0', 'a1'}, [
+            ConstraintSystem([a00, a11]),
+            ConstraintSystem([a00, a11, AnyConstraint('a0')]),
+            ConstraintSystem([a01, a10])
+        ])
+
+        self.assertEqual(oo, oo_diff)
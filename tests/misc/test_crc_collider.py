@@ -0,0 +1,33 @@
+from samson.auxiliary.crc_collider import CRCCollider
+from samson.utilities.bytes import Bytes
+import zlib
+import unittest
+
+
+class CRCColliderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.crc_func = lambda data: zlib.crc32(bytes(data))
+        self.collider = CRCCollider(self.crc_func, 5)
+
+
+    def test_getitem(self):
+        collider = self.collider
+        self.assertEqual(collider[-1], collider[len(collider)-1])
+
+        for i in (0, 1, 5, len(collider) // 2, len(collider)-1):
+            self.assertEqual(collider[i], collider.produce_collision(i))
+
+        with self.assertRaises(IndexError):
+            collider[len(collider)]
+
+
+    def test_iter(self):
+        collider   = self.collider
+        collisions = list(collider)
+        zero_crc   = self.crc_func(Bytes(bytes(5)))
+
+        self.assertEqual(len(collisions), len(collider))
+        self.assertEqual(set(collisions), {collider[i] for i in range(len(collider))})
+
+        for collision in collisions:
+            self.assertEqual(self.crc_func(collision), zero_crc)
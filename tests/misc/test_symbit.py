@@ -0,0 +1,121 @@
+from samson.auxiliary.symbit import *
+import unittest
+
+
+def f(a, b, c):
+    return (a & b) ^ (~c | a)
+
+
+class SymBitTestCase(unittest.TestCase):
+    def test_symfunc_eval(self):
+        sf = SymFunc.from_func(f)
+
+        for args in itertools.product(range(2), repeat=3):
+            self.assertEqual(bool(sf(*args)), bool(f(*args) & 1))
+
+
+    def test_symbolic_positional(self):
+        sf = SymFunc.from_func(f)
+
+        for args in itertools.product(range(2), repeat=3):
+            self.assertEqual(bool(sf.symbolic(*args).value), bool(sf(*args)))
+
+
+    def test_value(self):
+        sf = SymFunc.from_func(f)
+        self.assertEqual(str(sf.value), '(a + 1)*c + (a)*b + 1')
+        self.assertEqual(sf.get_parameters(), ['a', 'b', 'c'])
+
+
+    def test_bv_add(self):
+        def g(a: BitVector[3], b: BitVector[3]):
+            return ADVOP.ADD(a, b)
+
+        bv = BitVector.from_func(g)
+
+        for a in range(8):
+            for b in range(8):
+                self.assertEqual(bv(a, b).int(), (a + b) % 8)
+
+
+    def test_table_roundtrip(self):
+        sf  = SymFunc.from_func(f)
+        tab = sf.symbolic.build_output_table()
+        self.assertEqual(tab.build_symbit().anf, sf.anf)
+
+
+    def test_concrete_advop(self):
+        def g(a: BitVector[3], b: BitVector[3]):
+            return ADVOP.MUL(a, b)
+
+        bv = BitVector.from_func(g)
+
+        for a in range(8):
+            for b in range(8):
+                self.assertEqual(bv(a, b).int(), (a * b) % 8)
+                self.assertEqual(ADVOP.MUL(bv._coerce(a), bv._coerce(b)).int(), bv(a, b).int())
+
+
+    def test_symlist_getitem(self):
+        vals = [5, 3, 7, 1, 0, 2, 6, 4, 9]
+
+        def g(a: BitVector[4]):
+            return SymList([a._coerce(v) for v in vals])[a]
+
+        bv = BitVector.from_func(g)
+        self.assertEqual([bv(i).int() for i in range(16)], vals + [0]*7)
+
+
+    def test_serialize_roundtrip(self):
+        table = {args: int(args == (1, 1, 0)) for args in itertools.product(range(2), repeat=3)}
+        io    = IOTable(table, ['a', 'b', 'c'])
+        self.assertEqual(IOTable.deserialize(io.serialize()).table, table)
+
+
+    def test_eq_odd_size(self):
+        def g(a: BitVector[3], b: BitVector[3]):
+            return ADVOP.EQ(a, b)
+
+        bv = BitVector.from_func(g)
+
+        for a in range(8):
+            for b in range(8):
+                self.assertEqual(bv(a, b).int(), 7 if a == b else 0)
+                self.assertEqual(ADVOP.EQ(bv._coerce(a), bv._coerce(b)).int(), bv(a, b).int())
+
+
+    def test_compare_odd_size(self):
+        def gt(a: BitVector[3], b: BitVector[3]):
+            return ADVOP.GT(a, b)
+
+        def div(a: BitVector[3], b: BitVector[3]):
+            return ADVOP.DIV(a, b)
+
+        def vmax(a: BitVector[3], b: BitVector[3]):
+            return ADVOP.MAX(a, b)
+
+        bv_gt, bv_div, bv_max = [BitVector.from_func(g) for g in (gt, div, vmax)]
+        coerce = bv_gt._coerce
+
+        for a in range(8):
+            for b in range(8):
+                self.assertEqual(bool(bv_gt(a, b).int()), a > b)
+                self.assertEqual(bool(ADVOP.GT(coerce(a), coerce(b)).int()), a > b)
+                self.assertEqual(bv_max(a, b).int(), max(a, b))
+                self.assertEqual(ADVOP.MAX(coerce(a), coerce(b)).int(), max(a, b))
+
+                if b:
+                    self.assertEqual(bv_div(a, b).int(), a // b)
+                    self.assertEqual(ADVOP.DIV(coerce(a), coerce(b)).int(), a // b)
+
+
+    def test_advop_kwargs(self):
+        def g(a: BitVector[3], b: BitVector[3]):
+            return ADVOP.ADD(a, b=b, c=None)
+
+        bv = BitVector.from_func(g)
+
+        for a in range(8):
+            for b in range(8):
+                self.assertEqual(bv(a, b).int(), (a + b) % 8)
+                self.assertEqual(ADVOP.ADD(bv._coerce(a), b=bv._coerce(b), c=None).int(), bv(a, b).int())
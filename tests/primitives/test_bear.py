@@ -0,0 +1,30 @@
+from samson.block_ciphers.bear import BEAR
+from samson.stream_ciphers.salsa import Salsa
+from samson.macs.hmac import HMAC
+from samson.hashes.sha2 import SHA256
+from samson.utilities.bytes import Bytes
+import unittest
+
+
+class BEARTestCase(unittest.TestCase):
+    def _build(self, key, block_size):
+        return BEAR(
+            key,
+            hash_obj=lambda k: HMAC(k, SHA256()),
+            stream_cipher=lambda k: Salsa(k, b'\x00'*8),
+            key_schedule=lambda k: (k[:16], k[16:]),
+            block_size=block_size
+        )
+
+
+    def test_encrypt_decrypt(self):
+        for block_size in [512, 1024, 4096]:
+            bear = self._build(Bytes.random(32), block_size)
+
+            for _ in range(5):
+                plaintext  = Bytes.random(block_size // 8)
+                ciphertext = bear.encrypt(plaintext)
+
+                self.assertEqual(len(ciphertext), len(plaintext))
+                self.assertNotEqual(ciphertext, plaintext)
+                self.assertEqual(bear.decrypt(ciphertext), plaintext)
@@ -0,0 +1,29 @@
+from samson.block_ciphers.dinglebob import build_dinglebob
+from samson.utilities.bytes import Bytes
+import unittest
+
+
+class DINGLEBOBTestCase(unittest.TestCase):
+    def test_encrypt_decrypt(self):
+        DINGLEBOB = build_dinglebob(128)
+        cipher    = DINGLEBOB(Bytes.random(16))
+
+        for _ in range(5):
+            plaintext  = Bytes.random(16)
+            ciphertext = cipher.encrypt(plaintext)
+
+            self.assertEqual(len(ciphertext), 16)
+            self.assertEqual(cipher.decrypt(ciphertext), plaintext)
+
+
+    # Blocks with a leading zero byte must keep their full width
+    def test_short_block_width(self):
+        DINGLEBOB = build_dinglebob(16, ROUNDS=2, SUBKEY_SIZE=128)
+        cipher    = DINGLEBOB(Bytes(b'\x00'*16))
+
+        for i in range(512):
+            plaintext  = Bytes(int.to_bytes(i, 2, 'big'))
+            ciphertext = cipher.encrypt(plaintext)
+
+            self.assertEqual(len(ciphertext), 2)
+            self.assertEqual(cipher.decrypt(ciphertext), plaintext)
@@ -0,0 +1,20 @@
+from samson.constructions.fiat_shamir_proof_stream import FiatShamirProofStream
+from samson.utilities.bytes import Bytes
+import unittest
+
+
+class FiatShamirProofStreamTestCase(unittest.TestCase):
+    def test_read_hash_matches_write_hash(self):
+        stream  = FiatShamirProofStream()
+        objects = [Bytes(b'root'), [1, 2, 3], (Bytes(b'leaf'), 5)]
+        hashes  = []
+
+        for obj in objects:
+            stream.write(obj)
+            hashes.append(stream.hash())
+
+        self.assertEqual(len(set(hashes)), len(hashes))
+
+        for obj, h in zip(objects, hashes):
+            self.assertEqual(stream.read(), obj)
+            self.assertEqual(stream.hash(True), h)
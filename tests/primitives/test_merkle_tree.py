@@ -0,0 +1,48 @@
+from samson.constructions.merkle_tree import MerkleTree
+from samson.hashes.sha2 import SHA256
+from samson.hashes.sha3 import SHAKE256
+from samson.utilities.bytes import Bytes
+import unittest
+
+
+class MerkleTreeTestCase(unittest.TestCase):
+    def test_commit(self):
+        h     = SHA256().hash
+        leafs = [Bytes(i) for i in range(1, 5)]
+        l1    = [h(bytes(l)) for l in leafs]
+        root  = h(h(l1[0] + l1[1]) + h(l1[2] + l1[3]))
+
+        self.assertEqual(MerkleTree(h, leafs).commit(), root)
+
+
+    def test_open_verify(self):
+        h     = SHA256().hash
+        leafs = [Bytes.random(8) for _ in range(16)]
+        mt    = MerkleTree(h, leafs)
+        root  = mt.commit()
+
+        for i, leaf in enumerate(leafs):
+            path = mt.open(i)
+            self.assertEqual(len(path), 4)
+            self.assertTrue(MerkleTree(h).verify(root, i, path, leaf))
+            self.assertFalse(MerkleTree(h).verify(root, i ^ 1, path, leaf))
+
+
+    def test_default_hash(self):
+        leafs = [Bytes.random(8) for _ in range(8)]
+        self.assertEqual(MerkleTree(leafs=leafs).commit(), MerkleTree(SHAKE256(256).hash, leafs).commit())
+
+
+    def test_reassign_leafs(self):
+        h     = SHA256().hash
+        leafs = [Bytes.random(8) for _ in range(4)]
+        mt    = MerkleTree(h, leafs)
+        mt.commit()
+
+        mt.l1_hashes.clear()
+        self.assertEqual(mt.commit(), MerkleTree(h, leafs).commit())
+
+        new_leafs = [Bytes.random(8) for _ in range(4)]
+        mt.leafs  = new_leafs
+        self.assertEqual(mt.commit(), MerkleTree(h, new_leafs).commit())
+        self.assertEqual(mt.open(1), MerkleTree(h, new_leafs).open(1))